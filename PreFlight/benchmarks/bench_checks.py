@@ -0,0 +1,399 @@
+"""
+Preflight Benchmark - Checks
+Times the scene collection, the snapshot read, every registered check and the preflight window on generated
+scenes from preflight.fakehou, sweeping the ROP, AOV and light counts. Prints one scaling curve per sweep
+with the log-log slope of every timing (1.0 is linear, 2.0 quadratic), writes the results as JSON and fails
+on a regression against the baseline. Timings are the median CPU time of the process over the repeats and
+over several rounds that build every scene again, so other processes competing for the CPU do not inflate
+them, and every check runs with cold CameraInfo and AovTable caches so building them is timed too.
+
+The gate compares what a slower or busier machine leaves alone: the slope of every curve, so a check turning
+quadratic fails, and every timing relative to the rest of its run, so a check turning a constant factor slower
+fails. --absolute also compares the ms point by point, only meaningful against a baseline saved on the same
+machine. A timing is only compared when it stands out of the spread of its own rounds and repeats, see
+measurable().
+
+Usage
+    python benchmarks/bench_checks.py
+    python benchmarks/bench_checks.py --save-baseline          # after an intended change
+    python benchmarks/bench_checks.py --output /tmp/bench.json --slope-tolerance 0.3 --relative-tolerance 1.0
+    python benchmarks/bench_checks.py --absolute --tolerance 0.5   # on the machine that saved the baseline
+"""
+
+import argparse
+import json
+import math
+import os
+import sys
+import time
+
+PREFLIGHT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PREFLIGHT_DIR)
+
+from preflight import fakehou  # noqa: E402
+
+hou = fakehou.install()
+
+from preflight import core, logger  # noqa: E402
+
+BASELINE_PATH = os.path.join(PREFLIGHT_DIR, 'benchmarks', 'baseline.json')
+BASELINE_VERSION = 3
+
+# Scene generator arguments of every sweep, the swept argument replaced by each of its values
+SCENE_DEFAULTS = {'rops': 100, 'aovs': 16, 'cams': 2, 'domes': 1, 'lights': 0}
+SWEEPS = (
+    ('rops', (1, 10, 100, 1000), {}),
+    ('aovs', (0, 8, 16, 32, 64), {}),
+    ('lights', (0, 10, 100, 1000), {'rops': 10}),
+)
+
+# Window timings, not part of the run total they are compared relative to
+UI_KEYS = ('setupUi', 'window')
+
+# A timing is noise when its median is under NOISE_SPREADS times the median absolute deviation of its repeats,
+# or under TIMER_FLOOR_MS, the overhead of timing a call at all
+NOISE_SPREADS = 3.0
+TIMER_FLOOR_MS = 0.01
+
+
+def median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    return values[middle] if len(values) % 2 else (values[middle - 1] + values[middle]) / 2.0
+
+
+def spread(values):
+    middle = median(values)
+    return median([abs(value - middle) for value in values])
+
+
+def timed(func, repeats, setup=None):
+    """
+    Median and spread of repeats calls of func in ms, with the result of the last call. setup runs untimed
+    before every call
+    """
+    times = []
+    for _ in range(repeats):
+        if setup is not None:
+            setup()
+        start = time.process_time()
+        result = func()
+        times.append((time.process_time() - start) * 1000.0)
+    return median(times), spread(times), result
+
+
+def safeRun(check):
+    try:
+        return check.run()
+    except Exception as e:
+        return e
+
+
+def collect():
+    # Walk the scene every time, as a run does
+    core.invalidateSceneIndex()
+    core.setRopList()
+    core.setRsLight()
+
+
+def timeChecks(repeats):
+    """
+    Time collecting the scene nodes, reading the snapshot and every check on the current scene
+    """
+    times = {}
+    spreads = {}
+    errors = {}
+    times['collect'], spreads['collect'], _ = timed(collect, repeats)
+    times['snapshot'], spreads['snapshot'], _ = timed(core.setSnapshot, repeats)
+    for check in core.getChecks():
+        times[check.name], spreads[check.name], result = timed(lambda: safeRun(check), repeats,
+                                                              setup=core.clearSnapshotCaches)
+        if isinstance(result, Exception):
+            errors[check.name] = '{t}: {e}'.format(t=type(result).__name__, e=result)
+    times['total'] = sum(times.values())
+    spreads['total'] = sum(spreads.values())
+    return times, spreads, errors
+
+
+class UiTimer(object):
+    """
+    Times the preflight window, up to setupUi returning and up to the progressive run filling it in
+    """
+
+    def __init__(self):
+        from PySide2 import QtWidgets
+        from preflight import ui
+        self.QtWidgets = QtWidgets
+        self.ui = ui
+        self.app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    def time(self):
+        window = self.QtWidgets.QMainWindow()
+        main = self.ui.Ui_MainWindow()
+        start = time.process_time()
+        main.setupUi(window)
+        setup = time.process_time() - start
+        while main.run.timer.isActive():
+            self.app.processEvents()
+        filled = time.process_time() - start
+        main.run.stop()
+        window.deleteLater()
+        self.app.processEvents()
+        return {'setupUi': setup * 1000.0, 'window': filled * 1000.0}
+
+
+def timeUi(ui_timer, repeats):
+    runs = {}
+    for _ in range(repeats):
+        for key, value in ui_timer.time().items():
+            runs.setdefault(key, []).append(value)
+    return ({key: median(values) for key, values in runs.items()},
+            {key: spread(values) for key, values in runs.items()})
+
+
+def measurable(point, key):
+    """
+    Whether a timing of a point stands out of the noise, scaled to the spread of its own repeats
+    """
+    value = point['times'].get(key)
+    return value is not None and value >= TIMER_FLOOR_MS and value >= NOISE_SPREADS * point['spreads'][key]
+
+
+def relative(point, key):
+    """
+    A timing over the rest of its run, which a slower or busier machine scales alike
+    """
+    times = point['times']
+    rest = times['total'] if key in UI_KEYS else times['total'] - times[key]
+    return times[key] / rest if rest > 0 else None
+
+
+def slope(points, key):
+    """
+    Slope of log(time) over log(count) of the measurable points, the exponent of the curve. It is the median of
+    the slopes between every two points (Theil-Sen), so one noisy point does not tilt the curve
+    """
+    logs = [(math.log(point['x']), math.log(point['times'][key])) for point in points
+            if point['x'] > 0 and measurable(point, key)]
+    slopes = [(y2 - y1) / (x2 - x1) for i, (x1, y1) in enumerate(logs) for x2, y2 in logs[i + 1:] if x2 != x1]
+    return median(slopes) if slopes else None
+
+
+def timePoint(scene, repeats, ui_timer):
+    fakehou.buildScene(**scene)
+    times, spreads, errors = timeChecks(repeats)
+    if ui_timer is not None:
+        ui_times, ui_spreads = timeUi(ui_timer, repeats)
+        times.update(ui_times)
+        spreads.update(ui_spreads)
+    return times, spreads, errors
+
+
+def slopeNoise(points, key):
+    """
+    How far the spreads of a curve's measurable points could tilt its slope, a point off by its spread at one
+    end of the curve
+    """
+    measured = [point for point in points if point['x'] > 0 and measurable(point, key)]
+    if len(measured) < 2:
+        return 0.0
+    span = math.log(measured[-1]['x']) - math.log(measured[0]['x'])
+    worst = max(math.log1p(point['spreads'][key] / point['times'][key]) for point in measured)
+    return worst / span if span > 0 else 0.0
+
+
+def runSweeps(repeats, rounds, ui_timer):
+    """
+    Time every sweep point in each of rounds rounds, building its scene again every round, as one build of a
+    scene can time apart from the next while its repeats agree. A point keeps the median of its rounds, and as
+    spread the larger of the spread between the rounds and the median spread within them
+    """
+    runs = {}
+    for _ in range(rounds):
+        for name, values, overrides in SWEEPS:
+            for value in values:
+                scene = dict(SCENE_DEFAULTS, **overrides)
+                scene[name] = value
+                if name == 'lights':
+                    scene['domes'] = value
+                runs.setdefault((name, value), (scene, []))[1].append(timePoint(scene, repeats, ui_timer))
+
+    sweeps = {}
+    for name, values, overrides in SWEEPS:
+        points = []
+        for value in values:
+            scene, measured = runs[(name, value)]
+            times = {}
+            spreads = {}
+            for key in measured[0][0]:
+                values = [round_times[key] for round_times, round_spreads, errors in measured]
+                times[key] = median(values)
+                spreads[key] = max(spread(values), median([round_spreads[key] for _, round_spreads, _ in measured]))
+            points.append({'x': value, 'scene': scene, 'times': times, 'spreads': spreads,
+                           'errors': measured[-1][2]})
+
+        keys = list(points[0]['times'])
+        sweeps[name] = {'points': points, 'slopes': {key: slope(points, key) for key in keys}}
+    return sweeps
+
+
+def printCurves(sweeps):
+    for name, sweep in sweeps.items():
+        points = sweep['points']
+        print('\n{name} sweep, ms'.format(name=name))
+        header = '{key:<14}'.format(key='') + ''.join('{x:>10}'.format(x=point['x']) for point in points)
+        print(header + '{slope:>8}'.format(slope='slope'))
+        for key, value in sweep['slopes'].items():
+            row = '{key:<14}'.format(key=key) + ''.join('{t:>10.3f}'.format(t=point['times'][key])
+                                                         for point in points)
+            print(row + ('{s:>8.2f}'.format(s=value) if value is not None else '{s:>8}'.format(s='-')))
+        for point in points:
+            for check, error in point['errors'].items():
+                print("[Bench]{name}={x} {check} failed, {error}".format(name=name, x=point['x'], check=check,
+                                                                       error=error))
+
+
+def compareSlopes(results, baseline, tolerance):
+    """
+    Scaling curves steeper than in the baseline by more than tolerance, widened by the slopeNoise() of the curve
+    in both runs. Curves with less than two measurable points in either run have no slope and are skipped
+    """
+    regressions = []
+    for name, sweep in results['sweeps'].items():
+        base_sweep = baseline['sweeps'].get(name)
+        if base_sweep is None:
+            continue
+        for key, value in sweep['slopes'].items():
+            base_value = base_sweep['slopes'].get(key)
+            if value is None or base_value is None:
+                continue
+            noise = slopeNoise(sweep['points'], key) + slopeNoise(base_sweep['points'], key)
+            if value > base_value + tolerance + noise:
+                regressions.append('{name} sweep {key} slope {base:.2f} -> {value:.2f}'.format(
+                    name=name, key=key, base=base_value, value=value))
+    return regressions
+
+
+def pointPairs(results, baseline):
+    """
+    (sweep name, point, baseline point) of every point both runs timed
+    """
+    for name, sweep in results['sweeps'].items():
+        base_sweep = baseline['sweeps'].get(name)
+        if base_sweep is None:
+            continue
+        base_points = {point['x']: point for point in base_sweep['points']}
+        for point in sweep['points']:
+            base_point = base_points.get(point['x'])
+            if base_point is not None:
+                yield name, point, base_point
+
+
+def compareRelative(results, baseline, tolerance):
+    """
+    Curves whose timings take a larger share of their run than in the baseline by more than tolerance. The
+    share is taken against the rest of the run, so it grows with the slowdown, and the median of its rise over
+    the points measurable in both runs is compared, a constant factor raises every point while noise does not.
+    Curves with less than two such points are skipped
+    """
+    ratios = {}
+    for name, point, base_point in pointPairs(results, baseline):
+        for key in point['times']:
+            if key == 'total' or key not in base_point['times']:
+                continue
+            if not (measurable(point, key) and measurable(base_point, key)):
+                continue
+            value = relative(point, key)
+            base_value = relative(base_point, key)
+            if value is not None and base_value:
+                ratios.setdefault((name, key), []).append(value / base_value)
+
+    regressions = []
+    for (name, key), rises in ratios.items():
+        rise = median(rises)
+        if len(rises) > 1 and rise > 1.0 + tolerance:
+            regressions.append('{name} sweep {key} {rise:.2f}x its baseline share of the run'.format(
+                name=name, key=key, rise=rise))
+    return regressions
+
+
+def compare(results, baseline, tolerance):
+    """
+    Timings slower than the baseline by more than tolerance, skipping those not measurable in either run
+    """
+    regressions = []
+    for name, point, base_point in pointPairs(results, baseline):
+        for key, value in point['times'].items():
+            base_value = base_point['times'].get(key)
+            if base_value is None or not (measurable(point, key) and measurable(base_point, key)):
+                continue
+            if value > base_value * (1.0 + tolerance):
+                regressions.append('{name}={x} {key} {base:.3f} ms -> {value:.3f} ms'.format(
+                    name=name, x=point['x'], key=key, base=base_value, value=value))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the preflight checks on generated scenes')
+    parser.add_argument('--repeats', type=int, default=9, help='runs per timing, the median is kept')
+    parser.add_argument('--rounds', type=int, default=5,
+                        help='times every scene is built and timed again, the median round is kept')
+    parser.add_argument('--no-ui', action='store_true', help='skip timing the preflight window')
+    parser.add_argument('--output', help='write the results JSON here')
+    parser.add_argument('--baseline', default=BASELINE_PATH, help='baseline JSON to compare against')
+    parser.add_argument('--save-baseline', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--slope-tolerance', type=float, default=0.3,
+                        help='allowed rise of a scaling curve slope against the baseline')
+    parser.add_argument('--relative-tolerance', type=float, default=1.0,
+                        help='allowed rise of a curve share of its run, 1.0 is twice the share')
+    parser.add_argument('--absolute', action='store_true',
+                        help='also compare the ms of every point, for a baseline saved on this machine')
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='allowed slowdown of a point with --absolute, 0.5 is 50%%')
+    args = parser.parse_args(argv)
+
+    # Failing checks are reported with the curves instead of logging a traceback on every repeat
+    logger.setLevel('CRITICAL')
+
+    ui_timer = None
+    if not args.no_ui:
+        try:
+            ui_timer = UiTimer()
+        except ImportError:
+            print("[Bench]PySide2 not available, skipping the window timings")
+
+    results = {'version': BASELINE_VERSION, 'repeats': args.repeats, 'rounds': args.rounds,
+               'sweeps': runSweeps(args.repeats, args.rounds, ui_timer)}
+    printCurves(results['sweeps'])
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=4)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=4)
+        print("\n[Bench]Baseline saved to {path}".format(path=args.baseline))
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("\n[Bench]No baseline at {path}, run with --save-baseline".format(path=args.baseline))
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get('version') != BASELINE_VERSION:
+        print("\n[Bench]Baseline {path} is from another version, run with --save-baseline".format(
+            path=args.baseline))
+        return 1
+
+    regressions = compareSlopes(results, baseline, args.slope_tolerance)
+    regressions.extend(compareRelative(results, baseline, args.relative_tolerance))
+    if args.absolute:
+        regressions.extend(compare(results, baseline, args.tolerance))
+    for regression in regressions:
+        print("[Bench]Regression {r}".format(r=regression))
+    print("\n[Bench]{n} regressions".format(n=len(regressions)))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
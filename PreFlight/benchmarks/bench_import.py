@@ -0,0 +1,61 @@
+"""
+Preflight Benchmark - Core Import
+Times `import preflight.core` in fresh interpreters and fails when the fastest run is over the budget or when
+the import pulls in PySide2. Farm hython validation and preflight_batch.py pay this on every worker start.
+
+Usage
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --runs 20 --budget 30
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+CORE_IMPORT_BUDGET_MS = 50.0
+PREFLIGHT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_SCRIPT = '''
+import sys, time
+start = time.perf_counter()
+import preflight.core
+elapsed = time.perf_counter() - start
+qt = sorted(name for name in sys.modules if name.split('.')[0] in ('PySide2', 'PySide6', 'PyQt5'))
+print(elapsed * 1000.0)
+print(','.join(qt))
+'''
+
+
+def timeImport():
+    """
+    One cold import of preflight.core, returns the time in ms and any Qt modules it loaded
+    """
+    output = subprocess.check_output([sys.executable, '-c', IMPORT_SCRIPT], cwd=PREFLIGHT_DIR,
+                                     universal_newlines=True)
+    elapsed, qt = output.splitlines()[-2:]
+    return float(elapsed), [name for name in qt.split(',') if name]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the preflight.core import time')
+    parser.add_argument('--runs', type=int, default=10, help='fresh interpreters to time')
+    parser.add_argument('--budget', type=float, default=CORE_IMPORT_BUDGET_MS, help='budget in ms')
+    args = parser.parse_args(argv)
+
+    times = []
+    for run in range(args.runs):
+        elapsed, qt = timeImport()
+        if qt:
+            print("[Bench]preflight.core imported {qt}".format(qt=', '.join(qt)))
+            return 1
+        times.append(elapsed)
+
+    best = min(times)
+    print("[Bench]import preflight.core min {best:.2f} ms, max {worst:.2f} ms over {n} runs, budget {budget:.0f} ms"
+          .format(best=best, worst=max(times), n=len(times), budget=args.budget))
+    return 1 if best > args.budget else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
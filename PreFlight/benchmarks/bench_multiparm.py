@@ -0,0 +1,88 @@
+"""
+Preflight Benchmark - Multiparm Reads
+Times reading one RS_aov multiparm column with a parm() lookup per instance against a single globParms()
+call, on a Redshift ROP with a growing AOV count, next to the read preflight.core calibrates for that size.
+Runs on preflight.fakehou under plain Python and on real nodes under hython; on the fake every parm() is a
+dict lookup, so only hython shows where globParms() pays off for a Houdini and Redshift version.
+
+Usage
+    python benchmarks/bench_multiparm.py
+    hython benchmarks/bench_multiparm.py --pattern RS_aovID_*
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PREFLIGHT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PREFLIGHT_DIR)
+
+from preflight import fakehou  # noqa: E402
+
+hou = fakehou.installUnlessHoudini()
+
+from preflight import core  # noqa: E402
+
+COUNTS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+
+def best(func, repeats, calls):
+    """
+    Fastest of repeats batches of calls calls of func, in microseconds per call
+    """
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        times.append((time.perf_counter() - start) / calls * 1e6)
+    return min(times)
+
+
+def crossover(rows):
+    """
+    Smallest count from which the glob read is faster at every larger count, None if it never is
+    """
+    found = None
+    for count, by_name, by_glob, picked in reversed(rows):
+        if by_glob >= by_name:
+            break
+        found = count
+    return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark per name against globParms multiparm reads')
+    parser.add_argument('--pattern', default='RS_aovSuffix_*', help='multiparm column to read')
+    parser.add_argument('--repeats', type=int, default=5, help='batches per timing, the fastest is kept')
+    parser.add_argument('--calls', type=int, default=200, help='reads per batch')
+    args = parser.parse_args(argv)
+
+    rop = hou.node('/out').createNode('Redshift_ROP')
+    rows = []
+    try:
+        for count in COUNTS:
+            rop.parm('RS_aov').set(count)
+            by_name = best(lambda: core.readMultiparmByName(rop, args.pattern, count), args.repeats, args.calls)
+            by_glob = best(lambda: core.readMultiparmByGlob(rop, args.pattern, count), args.repeats, args.calls)
+            core.multiparm_readers.clear()
+            read, values = core.readMultiparm(rop, args.pattern, count)
+            rows.append((count, by_name, by_glob, 'glob' if read is core.readMultiparmByGlob else 'by name'))
+    finally:
+        rop.destroy()
+
+    backend = 'fakehou' if hou is fakehou else 'hou'
+    print("{pattern} on {backend}, us per read".format(pattern=args.pattern, backend=backend))
+    print("{c:>8}{n:>12}{g:>12}{p:>12}".format(c='count', n='by name', g='glob', p='picked'))
+    for count, by_name, by_glob, picked in rows:
+        print("{c:>8}{n:>12.2f}{g:>12.2f}{p:>12}".format(c=count, n=by_name, g=by_glob, p=picked))
+
+    found = crossover(rows)
+    print("\n[Bench]globParms wins from {found} instances, calibration starts at MULTIPARM_GLOB_MIN {current}"
+          .format(found=found if found is not None else 'never', current=core.MULTIPARM_GLOB_MIN))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+Preflight Benchmark - Read Backends
+Times the snapshot read with a HOM call per parm against one hscript opparm dump per node, with the parm(),
+eval() and hscript() calls each made. Under plain Python it sweeps generated preflight.fakehou scenes by ROP
+count; there every HOM call is a dict lookup, so formatting and parsing the dump costs more than it saves.
+Under hython it times the loaded hip files, which is where the round trips per node show.
+
+Usage
+    python benchmarks/bench_read.py
+    hython benchmarks/bench_read.py /shots/lighting/sh0100.hip --repeats 3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+PREFLIGHT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PREFLIGHT_DIR)
+
+from preflight import fakehou  # noqa: E402
+
+hou = fakehou.installUnlessHoudini()
+
+from preflight import core, logger, profiling  # noqa: E402
+
+ROP_COUNTS = (1, 10, 100, 500)
+
+
+def timeSnapshot(backend, repeats):
+    """
+    Fastest snapshot read of the collected nodes with backend in ms, with the profile of the last read
+    """
+    core.setReadBackend(backend)
+    times = []
+    for _ in range(repeats):
+        run_profile = profiling.Profile()
+        core.setProfile(run_profile)
+        start = time.perf_counter()
+        core.setSnapshot()
+        times.append((time.perf_counter() - start) * 1000.0)
+        core.setProfile(None)
+    return min(times), run_profile.totals('snapshot')
+
+
+def benchScene(label, repeats):
+    core.setScene(core.HomScene())
+    core.setRopList()
+    core.setRsLight()
+    row = [label, len(core.getRopList())]
+    for backend in core.READ_BACKENDS:
+        elapsed, counts = timeSnapshot(backend, repeats)
+        row.append((elapsed, counts))
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark the HOM and hscript snapshot read backends')
+    parser.add_argument('hips', nargs='*', help='hip files to load, hython only')
+    parser.add_argument('--repeats', type=int, default=5, help='reads per timing, the fastest is kept')
+    parser.add_argument('--aovs', type=int, default=16, help='AOVs per ROP of the generated scenes')
+    args = parser.parse_args(argv)
+    logger.setLevel(logger.ERROR)
+
+    rows = []
+    if hou is fakehou:
+        if args.hips:
+            parser.error('hip files need hython')
+        for rops in ROP_COUNTS:
+            fakehou.buildScene(rops=rops, aovs=args.aovs, cams=2, domes=1, lights=0)
+            rows.append(benchScene('fakehou', args.repeats))
+    else:
+        for hip in args.hips or [hou.hipFile.path()]:
+            if args.hips:
+                hou.hipFile.load(hip, suppress_save_prompt=True, ignore_load_warnings=True)
+            rows.append(benchScene(os.path.basename(hip), args.repeats))
+    core.setReadBackend('hom')
+
+    print("{s:<24}{r:>6}{h:>12}{c:>16}{x:>12}{d:>16}{p:>9}".format(
+        s='scene', r='ROPs', h='hom ms', c='parm/eval', x='hscript ms', d='parm/hscript', p='speedup'))
+    for label, rops, (hom, hom_counts), (dump, dump_counts) in rows:
+        print("{s:<24}{r:>6}{h:>12.2f}{c:>16}{x:>12.2f}{d:>16}{p:>8.2f}x".format(
+            s=label, r=rops, h=hom, c='{p}/{e}'.format(p=hom_counts.parm, e=hom_counts.eval), x=dump,
+            d='{p}/{h}'.format(p=dump_counts.parm, h=dump_counts.hscript), p=hom / dump if dump else 0.0))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
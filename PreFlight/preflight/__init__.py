@@ -0,0 +1,10 @@
+"""
+Houdini preflight checks
+    preflight.core       check registry, scene snapshot and the checks, no Qt
+    preflight.hipfile    offline .hip reader, no hou
+    preflight.opparm     hscript opparm dump command and parser for the hscript read backend
+    preflight.ui         preflight window, PySide2
+    preflight.profiling  per check timings and HOM call counts
+    preflight.logger     leveled preflight logger with an optional ring buffer
+    preflight.fakehou    in-memory hou and scene generator for running the checks without Houdini
+"""
@@ -0,0 +1,1682 @@
+"""
+Preflight check engine
+Finds the Redshift ROPs, render cameras, lights and domes of a scene, reads every parameter the registered
+checks declare into a snapshot once, and runs the checks on it. No Qt is imported here, so hython batch
+runs and farm-side validation only pay for the checks themselves; the window lives in preflight.ui.
+"""
+
+import bisect
+import fnmatch
+import os
+import re
+import time
+
+from preflight.logger import DEBUG, log
+from preflight.profiling import NO_PROFILE_SECTION
+
+# The offline hip reader runs the checks without a Houdini license
+try:
+    import hou
+except ImportError:
+    hou = None
+
+# Frame samples are NumPy arrays when NumPy is available, as it is in hython, see getNumpy()
+numpy = None
+
+# Global Variables
+default_cam = ''
+rop_list = []
+rsLights = []
+rsdomes = []
+snapshot = {}
+checks = []
+scene = None
+profile = None
+camera_infos = {}
+aov_tables = {}
+multiparm_readers = {}
+parm_kinds = {}
+scene_index = None
+type_matchers = {}
+
+# How the snapshot reads parms from a hou session: 'hom' calls parm().eval() per parm, 'hscript' reads each
+# node with one opparm dump and only evaluates what the dump does not hold as a literal. Offline scenes are
+# always read through their nodes
+READ_BACKENDS = ('hom', 'hscript')
+READ_BACKEND_ENV = 'PREFLIGHT_READ'
+read_backend = os.environ.get(READ_BACKEND_ENV, 'hom')
+
+# How time dependent parms are sampled: 'frames' evaluates every frame, 'changes' evaluates the frames around
+# the parm's keyframes and bisects between them to the frames its value changes on
+SAMPLE_MODES = ('frames', 'changes')
+SAMPLE_MODE_ENV = 'PREFLIGHT_SAMPLE'
+sample_mode = os.environ.get(SAMPLE_MODE_ENV, 'frames')
+
+# Keyframe segment expressions that move between the values of their two keys without leaving that range,
+# the 'changes' sample mode only bisects these. Bezier and cubic tangents can overshoot and expressions can
+# depend on $F, segments with any other expression are evaluated at every frame
+PLAIN_SEGMENT_RE = re.compile(r'^\s*(constant|linear|ease|easein|easeout|easep|easeinp|easeoutp)\(\s*[\d.]*\s*\)\s*$')
+
+# Interpolation of a key without an expression set, Houdini's default
+DEFAULT_SEGMENT = 'bezier()'
+
+# Multiparm counters, a declared parm pattern like RS_aovSuffix_* reads one value per instance of its counter
+MULTIPARMS = ('RS_aov',)
+
+# Columns of the per ROP AOV table and the RS_aov multiparm parms they are read from
+AOV_PARMS = (
+    ('id', 'RS_aovID_*'),
+    ('suffix', 'RS_aovSuffix_*'),
+    ('enabled', 'RS_aovEnable_*'),
+)
+
+# RS_aovID of the motion vector AOV
+AOV_MOTION_VECTORS = 2
+
+# Multiparms with fewer instances are read with a parm() lookup per instance. From this size on, the first
+# multiparm of every power of two size times that against one globParms() call and the faster read is kept
+# until setScene() starts the next scene, see benchmarks/bench_multiparm.py
+MULTIPARM_GLOB_MIN = 8
+
+# Timed runs of each read when calibrating, the fastest run of each is compared
+MULTIPARM_CALIBRATION_RUNS = 3
+
+# The node types a check can declare and the NodeType.nameWithCategory() patterns their nodes are found by, so
+# every version of a versioned HDA and the unversioned type match, wherever in the scene the node sits
+NODE_TYPE_PATTERNS = {
+    'Redshift_ROP': ('Driver/Redshift_ROP', 'Driver/Redshift_ROP::*', 'Driver/*::Redshift_ROP::*'),
+    'rslight': ('Object/rslight', 'Object/rslight::*', 'Object/*::rslight::*'),
+    'rslightdome': ('Object/rslightdome', 'Object/rslightdome::*', 'Object/*::rslightdome::*'),
+}
+
+# Child categories of the networks live mode watches for created and deleted nodes, the categories of the ROPs,
+# lights and cameras the checks read
+WATCHED_CATEGORIES = ('Driver', 'Object')
+
+# Parm tuples a check can declare by name, read with one parmTuple().eval() into a tuple of component values
+PARM_TUPLES = ('res',)
+
+# Parms also evaluated at every frame of their node's frame range when they are time dependent, so a resolution
+# change, a DOF or motion blur switch or GI toggled mid-shot is caught. Static parms keep their single eval
+SAMPLED_PARMS = ('res', 'RS_campro_dofEnable', 'MotionBlurEnabled', 'RS_GIEnabled')
+
+# ROP frame range parms, read whenever a sampled parm is planned
+FRAME_RANGE_PARMS = ('f1', 'f2', 'f3')
+
+
+class HomScene(object):
+    """
+    Scene access through the running hou session
+    """
+
+    def node(self, path):
+        return hou.node(path)
+
+    def allNodes(self):
+        # Locked assets can ship the ROPs and lights of a scene, so their contents are walked too
+        return hou.node('/').allSubChildren(recurse_in_locked_nodes=True)
+
+    def playbackRange(self):
+        return hou.playbar.playbackRange()
+
+    def hipName(self):
+        return hou.hipFile.basename()
+
+    def hasUnsavedChanges(self):
+        return hou.hipFile.hasUnsavedChanges()
+
+
+def getScene():
+    global scene
+    if scene is None:
+        scene = HomScene()
+    return scene
+
+
+def setScene(new_scene):
+    global scene
+    scene = new_scene
+    multiparm_readers.clear()
+    parm_kinds.clear()
+    invalidateSceneIndex()
+
+
+class SceneIndex(object):
+    """
+    Every node of the scene by type and by path, from one allSubChildren() walk shared by all node lookups,
+    and the ROP snapshots rendering each camera once the ROPs are read. Types are keyed like
+    'Driver/Redshift_ROP', as NodeType.nameWithCategory() names them
+    """
+
+    def __init__(self, nodes):
+        self.by_type = {}
+        self.by_path = {}
+        self.camera_rops = {}
+        self.watched = []
+        for node in nodes:
+            self.by_path[node.path()] = node
+            self.by_type.setdefault(node.type().nameWithCategory(), []).append(node)
+
+    def matching(self, node_type):
+        """
+        Nodes of every type matching the NODE_TYPE_PATTERNS of node_type, in walk order per type
+        """
+        matcher = getTypeMatcher(node_type)
+        nodes = []
+        for type_key, typed in self.by_type.items():
+            if matcher.match(type_key):
+                nodes.extend(typed)
+        return tuple(nodes)
+
+    def node(self, path):
+        """
+        Node at path, asking the scene only for paths the walk did not index, such as relative ones
+        """
+        node = self.by_path.get(path)
+        if node is None:
+            node = getScene().node(path)
+            if profile is not None:
+                profile.count(path, 'node')
+        return node
+
+    def setCameraRops(self, rops):
+        self.camera_rops = {}
+        for rop in rops:
+            self.camera_rops.setdefault(rop.eval('RS_renderCamera'), []).append(rop)
+
+    def networks(self):
+        """
+        Indexed networks whose children are WATCHED_CATEGORIES nodes, the only ones a ROP, light or camera can
+        be created in or deleted from. The child category is asked once per node type
+        """
+        networks = []
+        for nodes in self.by_type.values():
+            category = nodes[0].childTypeCategory()
+            if category is not None and category.name() in WATCHED_CATEGORIES:
+                networks.extend(nodes)
+        return networks
+
+    def watch(self, callback):
+        """
+        Call callback on every child created or deleted in a network that can hold ROPs, lights or cameras
+        """
+        event_types = (hou.nodeEventType.ChildCreated, hou.nodeEventType.ChildDeleted)
+        for network in self.networks():
+            network.addEventCallback(event_types, callback)
+            self.watched.append(network)
+
+    def unwatch(self, callback):
+        event_types = (hou.nodeEventType.ChildCreated, hou.nodeEventType.ChildDeleted)
+        for network in self.watched:
+            try:
+                network.removeEventCallback(event_types, callback)
+            except (hou.ObjectWasDeleted, hou.OperationFailed):
+                pass
+        self.watched = []
+
+
+class TypeMatcher(object):
+    """
+    nameWithCategory() patterns like 'Object/rslightdome::*' compiled into one regular expression. Every type
+    tested is remembered for the session, so a scene only pays for the types it adds
+    """
+    __slots__ = ('regex', 'matches')
+
+    def __init__(self, patterns):
+        self.regex = re.compile('|'.join(fnmatch.translate(pattern) for pattern in patterns))
+        self.matches = {}
+
+    def match(self, type_key):
+        found = self.matches.get(type_key)
+        if found is None:
+            found = self.matches[type_key] = self.regex.match(type_key) is not None
+        return found
+
+
+def getTypeMatcher(node_type):
+    matcher = type_matchers.get(node_type)
+    if matcher is None:
+        matcher = type_matchers[node_type] = TypeMatcher(NODE_TYPE_PATTERNS[node_type])
+    return matcher
+
+
+def getSceneIndex():
+    """
+    The SceneIndex of the current scene, walking it when no index is built
+    """
+    global scene_index
+    if scene_index is None:
+        with profileSection('collect'):
+            scene_index = SceneIndex(getScene().allNodes())
+        log.debug("[SceneIndex]%s nodes indexed", len(scene_index.by_path))
+    return scene_index
+
+
+def invalidateSceneIndex():
+    global scene_index
+    scene_index = None
+
+
+def getProfile():
+    global profile
+    return profile
+
+
+def setProfile(new_profile):
+    """
+    Record the next runs into new_profile, a preflight.profiling.Profile, or stop recording with None
+    """
+    global profile
+    profile = new_profile
+
+
+def profileSection(name):
+    if profile is None:
+        return NO_PROFILE_SECTION
+    return profile.section(name)
+
+
+def getReadBackend():
+    global read_backend
+    return read_backend
+
+
+def setReadBackend(backend):
+    """
+    Read the snapshot with backend, one of READ_BACKENDS
+    """
+    global read_backend
+    if backend not in READ_BACKENDS:
+        raise ValueError('unknown read backend {b}, expected one of {r}'.format(
+            b=backend, r=', '.join(READ_BACKENDS)))
+    read_backend = backend
+
+
+def getNumpy():
+    """
+    NumPy, imported on first use so importing preflight.core stays cheap. None when it is not installed
+    """
+    global numpy
+    if numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+    return numpy
+
+
+def getSampleMode():
+    global sample_mode
+    return sample_mode
+
+
+def setSampleMode(mode):
+    """
+    Sample time dependent parms with mode, one of SAMPLE_MODES
+    """
+    global sample_mode
+    if mode not in SAMPLE_MODES:
+        raise ValueError('unknown sample mode {m}, expected one of {s}'.format(m=mode, s=', '.join(SAMPLE_MODES)))
+    sample_mode = mode
+
+
+def getDefaultCam():
+    global default_cam
+    return default_cam
+
+
+def setDefaultCam(cam):
+    global default_cam
+    default_cam = cam
+
+
+def getRsLight():
+    global rsLights, rsdomes
+    domes = rsdomes
+    lights = rsLights
+    return lights, domes
+
+
+def setRsLight():
+    global rsLights, rsdomes
+    lights = getSceneIndex().matching('rslight')
+    domes = getSceneIndex().matching('rslightdome')
+    rsLights = lights
+    rsdomes = domes
+
+
+def getRopList():
+    global rop_list
+    rops = rop_list
+    return rops
+
+
+def setRopList():
+    global rop_list
+    rop_list = getSceneIndex().matching('Redshift_ROP')
+
+
+def cameraGroups(rops):
+    """
+    Render cameras of the ROP snapshots in order of first use, each with the names of the ROPs rendering
+    through it, and the camera most ROPs render through. A tie goes to the camera path first in sort order,
+    so the choice never depends on node order
+    """
+    groups = {}
+    for rop in rops:
+        groups.setdefault(rop.eval('RS_renderCamera'), []).append(rop.name)
+    if not groups:
+        return groups, ''
+    return groups, min(groups, key=lambda cam: (-len(groups[cam]), cam))
+
+
+# Severities of a check Finding, ordered so the worst of a run is their max()
+SEVERITY_INFO = 0
+SEVERITY_WARNING = 1
+SEVERITY_ERROR = 2
+SEVERITY_NAMES = ('info', 'warning', 'error')
+
+# Message of every Finding key, formatted with the node name and path, the frames of its span and its values
+MESSAGES = {
+    'camera_rendered_by': '{path} rendered by {rops}',
+    'camera_missing': '{path} rendered by {rops} does not exist',
+    'rops_missing': 'No Redshift ROPs found',
+    'render_camera_missing': 'No render camera',
+    'camera_resolution': '{path}{frames} {value[0]} x {value[1]}',
+    'camera_aspect': '{path}{frames} {value}',
+    'camera_aspect_invalid': '{path}{frames} pixel aspect {value} is over 2',
+    'camera_dof_enabled': '{path}{frames} DOF Enabled',
+    'camera_dof_disabled': '{path}{frames} DOF Disabled',
+    'camera_clip': '{path}{frames} {value[0]} - {value[1]}',
+    'frame_range': '{name} set to {first} - {last}',
+    'aovs_missing': '{name} has no enabled AOVs',
+    'zdepth_disabled': '{name} Z-Depth Disabled',
+    'motion_blur_vector': '{name} Motion Blur and Vector enabled{frames}',
+    'motion_blur': '{name} Motion Blur Enabled{frames}',
+    'motion_vector': '{name} Motion Vector Enabled{frames}',
+    'gi_enabled': '{name} GI Enabled{frames}',
+    'gi_disabled': '{name} GI Disabled{frames}',
+    'crypto_missing': '{name} Crypto Missing or Disabled',
+    'crypto_matte_missing': '{name} Crypto Matte Missing or Disabled',
+    'crypto_obj_missing': '{name} Crypto OBJ Missing or Disabled',
+    'dome_background_on': '{name} background is ON',
+    'dome_background_off': '{name} background is OFF',
+    'dome_backplate_on': '{name} backplate is ON',
+    'dome_backplate_off': '{name} backplate is OFF',
+    'rs_env_enabled': '{name} has RS ENV Enabled',
+    'rs_env_unknown': '{name} has no RS_globalEnvironment parm, RS ENV unknown',
+    'file_saved': 'File Saved',
+    'file_not_saved': 'File Not Saved',
+}
+
+# CameraInfo settings read from a sampled parm
+CAMERA_SAMPLED = (('res', 'res'), ('dof', 'RS_campro_dofEnable'))
+
+
+class CameraInfo(object):
+    """
+    Settings of one render camera, built once from its snapshot and shared by every camera check. Settings
+    no registered check declares are None
+    """
+    __slots__ = ('record', 'path', 'name', 'res', 'aspect', 'dof', 'clip', 'spans')
+
+    def __init__(self, cam):
+        values = cam.values
+        self.record = cam
+        self.path = cam.path
+        self.name = cam.name
+        self.res = values.get('res')
+        self.aspect = values.get('aspect')
+        self.dof = values.get('RS_campro_dofEnable')
+        self.clip = (values.get('near'), values.get('far'))
+        # Frame spans of the settings changing over the frames this camera renders
+        self.spans = {}
+        for setting, parm in CAMERA_SAMPLED:
+            spans = animatedSpans(cam, parm)
+            if spans is not None:
+                self.spans[setting] = spans
+
+
+def getCameraInfo(cam):
+    """
+    CameraInfo of a camera snapshot, rebuilt only when the snapshot record was replaced
+    """
+    info = camera_infos.get(cam.path)
+    if info is None or info.record is not cam:
+        info = camera_infos[cam.path] = CameraInfo(cam)
+    return info
+
+
+def getCameraInfos():
+    return [getCameraInfo(cam) for cam in getSnapshot('cam')]
+
+
+def cameraValues(setting):
+    """
+    A CameraInfo setting of the default camera, and (path, None, None, value) of every other render camera
+    with a different value. A camera animating the setting gets one (path, start, end, value) per span of
+    frames holding a different value instead, the default camera included. The value is None when there is no
+    default camera, because the scene has no ROPs or the camera they render does not exist
+    """
+    default_cam = getNodeSnapshot('cam', getDefaultCam())
+    default = getCameraInfo(default_cam) if default_cam is not None else None
+    value = getattr(default, setting) if default is not None else None
+    others = []
+    for cam in getCameraInfos():
+        spans = cam.spans.get(setting)
+        if spans is not None:
+            others.extend((cam.path, start, end, span_value) for start, end, span_value in spans
+                          if span_value != value)
+        elif cam is not default and getattr(cam, setting) != value:
+            others.append((cam.path, None, None, getattr(cam, setting)))
+    return value, others
+
+
+def cameraFindings(check, setting, key, invalid=None, invalid_key=None):
+    """
+    A CameraInfo setting of the default camera and the Findings of cameraValues(): a warning keyed by key(value)
+    for every render camera that differs, and an error keyed invalid_key for any value invalid() flags, the
+    default camera's included. No default camera is an error of its own
+    """
+    value, others = cameraValues(setting)
+    findings = []
+    if value is None:
+        findings.append(Finding(check, SEVERITY_ERROR, '', 'render_camera_missing'))
+    elif invalid is not None and invalid(value):
+        findings.append(Finding(check, SEVERITY_ERROR, getDefaultCam(), invalid_key, {'value': value}))
+    for path, start, end, cam_value in others:
+        values = dict(spanValues(start, end) or {}, value=cam_value)
+        if invalid is not None and invalid(cam_value):
+            findings.append(Finding(check, SEVERITY_ERROR, path, invalid_key, values))
+        else:
+            findings.append(Finding(check, SEVERITY_WARNING, path, key(cam_value), values))
+    return value, findings
+
+
+class Aov(object):
+    __slots__ = ('index', 'id', 'suffix', 'enabled')
+
+    def __init__(self, index, id, suffix, enabled):
+        self.index = index
+        self.id = id
+        self.suffix = suffix
+        self.enabled = enabled
+
+    def isEnabled(self):
+        # Older ROPs have no per AOV toggle
+        return self.enabled is None or bool(self.enabled)
+
+
+class AovTable(object):
+    """
+    The AOVs of one ROP, built once from its snapshot and shared by every AOV check, with the ids and suffixes
+    of the enabled ones for lookups. Columns no check reads are None
+    """
+    __slots__ = ('record', 'aovs', 'enabled_ids', 'enabled_suffixes')
+
+    def __init__(self, rop):
+        values = rop.values
+        count = values.get('RS_aov', 0)
+        columns = [values.get(pattern) or [None] * count for field, pattern in AOV_PARMS]
+        self.record = rop
+        self.aovs = [Aov(i + 1, *row) for i, row in enumerate(zip(*columns))]
+        self.enabled_ids = set()
+        self.enabled_suffixes = set()
+        for aov in self.aovs:
+            if aov.isEnabled():
+                self.enabled_ids.add(aov.id)
+                self.enabled_suffixes.add(aov.suffix)
+
+    def enabled(self):
+        return [aov for aov in self.aovs if aov.isEnabled()]
+
+    def hasId(self, aov_id):
+        return aov_id in self.enabled_ids
+
+    def hasSuffix(self, suffix):
+        return suffix in self.enabled_suffixes
+
+
+def getAovTable(rop):
+    """
+    AovTable of a ROP snapshot, rebuilt only when the snapshot record was replaced
+    """
+    table = aov_tables.get(rop.path)
+    if table is None or table.record is not rop:
+        table = aov_tables[rop.path] = AovTable(rop)
+    return table
+
+
+def getRenderCams():
+    index = getSceneIndex()
+    index.setCameraRops(getSnapshot('Redshift_ROP'))
+    cams = []
+    for path in index.camera_rops:
+        cam = index.node(path)
+        if cam is not None:
+            cams.append(cam)
+    return cams
+
+
+# Where the instances of each node type a check can declare come from, in snapshot order
+NODE_SOURCES = (
+    ('Redshift_ROP', getRopList),
+    ('cam', getRenderCams),
+    ('rslight', lambda: getRsLight()[0]),
+    ('rslightdome', lambda: getRsLight()[1]),
+)
+
+
+class Check(object):
+    """
+    A registered preflight check, with the node types and parameters it reads
+    """
+    __slots__ = ('func', 'nodes', 'section', 'title', 'display')
+
+    def __init__(self, func, nodes, section, title, display):
+        self.func = func
+        self.nodes = nodes
+        self.section = section
+        self.title = title
+        self.display = display
+
+    @property
+    def name(self):
+        return self.func.__name__
+
+    def run(self):
+        return self.func()
+
+
+def registerCheck(section=None, title=None, nodes=None, display=None):
+    """
+    Decorator adding a check to the registry. nodes maps node type to the parm names the check reads,
+    checks without a section are planned but not shown in the window
+    """
+    def register(func):
+        checks.append(Check(func, nodes or {}, section, title, display))
+        return func
+    return register
+
+
+def getChecks():
+    global checks
+    return checks
+
+
+def multiparmCounter(pattern):
+    counters = [c for c in MULTIPARMS if pattern.startswith(c)]
+    return max(counters, key=len)
+
+
+def planParms():
+    """
+    Union of every parm declared by the registered checks, per node type
+    """
+    plan = {}
+    for check in getChecks():
+        for node_type, parms in check.nodes.items():
+            plan.setdefault(node_type, set()).update(parms)
+
+    # Render cameras are found through the ROPs
+    if 'cam' in plan:
+        plan.setdefault('Redshift_ROP', set()).add('RS_renderCamera')
+
+    # Sampled parms are evaluated over the ROP frame ranges
+    if any(p in SAMPLED_PARMS for parms in plan.values() for p in parms):
+        plan.setdefault('Redshift_ROP', set()).update(FRAME_RANGE_PARMS)
+
+    for parms in plan.values():
+        parms.update([multiparmCounter(p) for p in parms if p.endswith('*')])
+    return plan
+
+
+def readMultiparmByName(node, pattern, count):
+    """
+    Values of the count instances of a multiparm pattern like RS_aovSuffix_*, one parm() lookup each.
+    Multiparm instance parms vary between Redshift versions, a missing one reads as None
+    """
+    instances = [node.parm(pattern[:-1] + str(i + 1)) for i in range(count)]
+    return [parm.eval() if parm is not None else None for parm in instances]
+
+
+def readMultiparmByGlob(node, pattern, count):
+    """
+    Same as readMultiparmByName with a single globParms() call finding every instance
+    """
+    values = [None] * count
+    prefix = len(pattern) - 1
+    for parm in node.globParms(pattern):
+        index = parm.name()[prefix:]
+        if index.isdigit() and 0 < int(index) <= count:
+            values[int(index) - 1] = parm.eval()
+    return values
+
+
+def calibrateMultiparm(node, pattern, count):
+    """
+    The faster read of a multiparm and the values it read. The reads take turns for MULTIPARM_CALIBRATION_RUNS
+    runs each and their fastest runs are compared, so a single pause or a cold cache does not pick the read
+    for the whole session
+    """
+    by_name = by_glob = float('inf')
+    for _ in range(MULTIPARM_CALIBRATION_RUNS):
+        start = time.perf_counter()
+        values = readMultiparmByName(node, pattern, count)
+        by_name = min(by_name, time.perf_counter() - start)
+        start = time.perf_counter()
+        readMultiparmByGlob(node, pattern, count)
+        by_glob = min(by_glob, time.perf_counter() - start)
+    read = readMultiparmByGlob if by_glob < by_name else readMultiparmByName
+    log.debug("[Snapshot]%s instances of %s read by name in %.1f us, by glob in %.1f us", count, pattern,
+              by_name * 1e6, by_glob * 1e6)
+    return read, values
+
+
+def readMultiparm(node, pattern, count):
+    """
+    Values of a multiparm of count instances and the read that got them, the faster one for its size. The
+    first multiparm of a size calibrates the reads and its values come from the calibration runs
+    """
+    if count < MULTIPARM_GLOB_MIN:
+        return readMultiparmByName, readMultiparmByName(node, pattern, count)
+    size = count.bit_length()
+    read = multiparm_readers.get(size)
+    if read is None:
+        read, values = calibrateMultiparm(node, pattern, count)
+        multiparm_readers[size] = read
+        return read, values
+    return read, read(node, pattern, count)
+
+
+def readParmsHom(node, path, parms, values):
+    """
+    Read parms of node into values with a parm() lookup and an eval() each, multiparm patterns with the
+    read readMultiparm() picks for their size
+    """
+    patterns = [p for p in parms if p.endswith('*')]
+    # Parms vary between HDA versions of a node type, a missing one reads as None
+    for parm in parms:
+        if parm in PARM_TUPLES:
+            parm_tuple = node.parmTuple(parm)
+            values[parm] = tuple(parm_tuple.eval()) if parm_tuple is not None else None
+        elif not parm.endswith('*'):
+            instance = node.parm(parm)
+            values[parm] = instance.eval() if instance is not None else None
+
+    lookups = evals = len(parms) - len(patterns)
+    for pattern in patterns:
+        count = values[multiparmCounter(pattern)]
+        read, values[pattern] = readMultiparm(node, pattern, count)
+        lookups += 1 if read is readMultiparmByGlob else count
+        evals += count
+
+    if profile is not None:
+        profile.count(path, 'parm', lookups)
+        profile.count(path, 'eval', evals)
+
+
+def parmKind(node, type_key, name):
+    """
+    (parm template type name, menu tokens) of parm name, or of the first instance of a multiparm pattern,
+    for converting dumped values. Looked up once per node type, None when node has no such parm
+    """
+    kind = parm_kinds.get((type_key, name))
+    if kind is None:
+        lookup = name[:-1] + '1' if name.endswith('*') else name
+        parm = node.parmTuple(lookup) if name in PARM_TUPLES else node.parm(lookup)
+        if parm is None:
+            return None
+        template = parm.parmTemplate()
+        menu = tuple(template.menuItems()) if hasattr(template, 'menuItems') else ()
+        kind = parm_kinds[(type_key, name)] = (template.type().name(), menu)
+    return kind
+
+
+def readParmsHscript(node, path, parms, values):
+    """
+    Read parms of node into values from one opparm dump, typed by their parm templates. Parms the dump does
+    not hold as a literal, such as expressions, animated parms or parms missing from it, are read through HOM
+    """
+    # Imported here, the opparm parser pulls in the hip file reader the HOM backend never needs
+    from preflight import opparm
+    out, err = hou.hscript(opparm.dumpCommand(path, opparm.dumpNames(parms)))
+    if err and log.isEnabledFor(DEBUG):
+        log.debug("[Snapshot]opparm %s: %s", path, err.strip())
+    dump = opparm.parseDump(out)
+    if profile is not None:
+        profile.count(path, 'hscript')
+    type_key = node.type().nameWithCategory()
+
+    unresolved = []
+    for parm in parms:
+        if parm.endswith('*'):
+            continue
+        kind = parmKind(node, type_key, parm)
+        if parm in PARM_TUPLES:
+            value = opparm.tupleValue(dump, parm)
+            if value is not opparm.UNRESOLVED:
+                value = tuple(opparm.typedValue(component, kind) for component in value)
+                if opparm.UNRESOLVED in value:
+                    value = opparm.UNRESOLVED
+        else:
+            value = opparm.typedValue(opparm.parmValue(dump, parm), kind)
+        if value is opparm.UNRESOLVED:
+            unresolved.append(parm)
+        else:
+            values[parm] = value
+    if unresolved:
+        readParmsHom(node, path, unresolved, values)
+
+    evals = 0
+    for pattern in [p for p in parms if p.endswith('*')]:
+        instances = values[pattern] = []
+        count = values[multiparmCounter(pattern)]
+        kind = parmKind(node, type_key, pattern) if count else None
+        for i in range(count):
+            value = opparm.typedValue(opparm.parmValue(dump, pattern[:-1] + str(i + 1)), kind)
+            if value is opparm.UNRESOLVED:
+                # Read like readMultiparmByName()
+                parm = node.parm(pattern[:-1] + str(i + 1))
+                value = parm.eval() if parm is not None else None
+                evals += 1
+            instances.append(value)
+
+    if evals and profile is not None:
+        profile.count(path, 'parm', evals)
+        profile.count(path, 'eval', evals)
+
+
+class NodeSnapshot(object):
+    """
+    Planned parameter values of a single node, read once so every check can share them. samples holds the
+    FrameSamples of the time dependent parms, see sampleParms()
+    """
+    __slots__ = ('name', 'path', 'values', 'samples')
+
+    def __init__(self, node, parms):
+        self.name = node.name()
+        self.path = node.path()
+        self.values = {}
+        self.samples = {}
+        if read_backend == 'hscript' and isinstance(getScene(), HomScene):
+            readParmsHscript(node, self.path, parms, self.values)
+        else:
+            readParmsHom(node, self.path, parms, self.values)
+
+    def eval(self, parm):
+        if profile is not None:
+            profile.count(self.path, 'read')
+        return self.values[parm]
+
+
+class FrameSamples(object):
+    """
+    Values of one time dependent parm at the sampled frames, NumPy arrays when NumPy is available and lists
+    otherwise. A parm tuple has one row of component values per frame. Frames in between samples hold the
+    value of the sample before them, so every change of value lies between two adjacent frames
+    """
+    __slots__ = ('frames', 'values')
+
+    def __init__(self, frames, values):
+        np = getNumpy()
+        if np is not None:
+            frames = np.array(frames)
+            values = np.array(values)
+        self.frames = frames
+        self.values = values
+
+    def changes(self):
+        """
+        Indices of the samples holding a different value than the sample before them
+        """
+        np = getNumpy()
+        if np is not None:
+            differs = self.values[1:] != self.values[:-1]
+            if differs.ndim > 1:
+                differs = differs.any(axis=1)
+            return (np.flatnonzero(differs) + 1).tolist()
+        return [i for i in range(1, len(self.values)) if self.values[i] != self.values[i - 1]]
+
+    def value(self, index):
+        value = self.values[index]
+        if hasattr(value, 'tolist'):
+            value = value.tolist()
+        return tuple(value) if isinstance(value, list) else value
+
+    def spans(self):
+        """
+        (first frame, last frame, value) of every run of frames holding the same value
+        """
+        starts = [0] + self.changes()
+        ends = [start - 1 for start in starts[1:]] + [len(self.frames) - 1]
+        return [(float(self.frames[start]), float(self.frames[end]), self.value(start))
+                for start, end in zip(starts, ends)]
+
+
+def sampleFrames(node_type, record):
+    """
+    Frames a time dependent parm of record is evaluated at: a ROP's own frame range, the ranges of the ROPs
+    rendering a camera, and the playback range for anything else
+    """
+    if node_type == 'Redshift_ROP':
+        rops = [record]
+    elif node_type == 'cam':
+        rops = getSceneIndex().camera_rops.get(record.path, [])
+    else:
+        rops = []
+
+    if rops:
+        start = min(rop.values['f1'] for rop in rops)
+        end = max(rop.values['f2'] for rop in rops)
+        step = min(rop.values['f3'] for rop in rops) or 1
+    else:
+        start, end = getScene().playbackRange()
+        step = 1
+    count = max(int((end - start) / step + 1e-6) + 1, 1)
+    return [start + i * step for i in range(count)]
+
+
+def isPlainSegment(key):
+    expression = key.expression() if key.isExpressionSet() else DEFAULT_SEGMENT
+    return PLAIN_SEGMENT_RE.match(expression) is not None
+
+
+def sampleChanges(evaluate, frames, keys, dense=()):
+    """
+    (frames, values) of the frames a keyframed parm is evaluated at to find the frames its value changes on.
+    The first and last frame and the frames around every key are evaluated, then each pair of neighbours
+    holding different values is bisected down to adjacent frames, O(keys * log frames) evals. This assumes
+    the value between two keys only moves one way, so neighbours holding the same value have no change
+    between them. That holds for plain interpolations, the (first frame, last frame) dense spans of segments
+    where it may not are evaluated at every frame instead
+    """
+    values = {}
+
+    def at(index):
+        if index not in values:
+            values[index] = evaluate(frames[index])
+        return values[index]
+
+    last = len(frames) - 1
+    checkpoints = {0, last}
+    for key in keys:
+        index = bisect.bisect_left(frames, key)
+        checkpoints.update(i for i in (index - 1, index) if 0 <= i <= last)
+    for start, end in dense:
+        checkpoints.update(range(bisect.bisect_left(frames, start), bisect.bisect_right(frames, end)))
+    checkpoints = sorted(checkpoints)
+
+    pending = list(zip(checkpoints, checkpoints[1:]))
+    while pending:
+        low, high = pending.pop()
+        if high - low > 1 and at(low) != at(high):
+            middle = (low + high) // 2
+            at(middle)
+            pending.append((low, middle))
+            pending.append((middle, high))
+
+    for index in checkpoints:
+        at(index)
+    indices = sorted(values)
+    return [frames[i] for i in indices], [values[i] for i in indices]
+
+
+def sampleParms(node_type, node, record, parms):
+    """
+    Evaluate the planned SAMPLED_PARMS of node that are time dependent over the frames of sampleFrames() into
+    record.samples, at every frame or, in the 'changes' sample mode, around the frames their value changes
+    on. Parms without keyframes, driven by an expression, and key segments that are not a plain interpolation
+    are evaluated at every frame. Offline scenes hold one saved value per parm and are not sampled
+    """
+    sampled = [p for p in parms if p in SAMPLED_PARMS]
+    if not sampled or not isinstance(getScene(), HomScene):
+        return
+
+    frames = None
+    evals = 0
+    for name in sampled:
+        if name in PARM_TUPLES:
+            parm = node.parmTuple(name)
+            components = tuple(parm) if parm is not None else ()
+        else:
+            parm = node.parm(name)
+            components = (parm,) if parm is not None else ()
+        if not any(component.isTimeDependent() for component in components):
+            continue
+        if name in PARM_TUPLES:
+            evaluate = lambda frame, parm=parm: tuple(parm.evalAtFrame(frame))
+        else:
+            evaluate = parm.evalAtFrame
+
+        if frames is None:
+            frames = sampleFrames(node_type, record)
+        keys = []
+        dense = []
+        if sample_mode == 'changes':
+            for component in components:
+                component_keys = component.keyframes()
+                for index, key in enumerate(component_keys):
+                    keys.append(key.frame())
+                    if not isPlainSegment(key):
+                        end = component_keys[index + 1].frame() if index + 1 < len(component_keys) else frames[-1]
+                        dense.append((key.frame(), end))
+        if keys:
+            sample_frames, values = sampleChanges(evaluate, frames, keys, dense)
+        else:
+            sample_frames, values = frames, [evaluate(frame) for frame in frames]
+        record.samples[name] = FrameSamples(sample_frames, values)
+        evals += len(sample_frames)
+
+    if profile is not None:
+        profile.count(record.path, 'parm', len(sampled))
+        profile.count(record.path, 'eval', evals)
+
+
+def readNodeSnapshot(node_type, node, parms):
+    record = NodeSnapshot(node, parms)
+    sampleParms(node_type, node, record, parms)
+    return record
+
+
+def animatedSpans(record, parm):
+    """
+    Frame spans of a sampled parm of record whose value changes over its frames, None otherwise
+    """
+    samples = record.samples.get(parm)
+    if samples is None:
+        return None
+    spans = samples.spans()
+    return spans if len(spans) > 1 else None
+
+
+def parmSpans(record, parm):
+    """
+    (first frame, last frame, value) runs of a sampled parm of record, a single (None, None, value) when the
+    parm holds one value over its frames
+    """
+    spans = animatedSpans(record, parm)
+    if spans is None:
+        samples = record.samples.get(parm)
+        return [(None, None, samples.value(0) if samples is not None else record.eval(parm))]
+    return spans
+
+
+def spanText(start, end):
+    """
+    ' frames 10 - 24' for a span of frames, empty for the span of a static parm
+    """
+    if start is None:
+        return ''
+    if start == end:
+        return ' frame {s:g}'.format(s=start)
+    return ' frames {s:g} - {e:g}'.format(s=start, e=end)
+
+
+def getSnapshot(node_type):
+    global snapshot
+    return snapshot.get(node_type, [])
+
+
+def getNodeSnapshot(node_type, path):
+    for node in getSnapshot(node_type):
+        if node.path == path:
+            return node
+
+
+def iterSnapshot():
+    """
+    Build the snapshot one node at a time, yielding after each node so a caller can stay responsive
+    """
+    global snapshot
+    plan = planParms()
+    snapshot = {}
+    clearSnapshotCaches()
+    for node_type, source in NODE_SOURCES:
+        if node_type in plan:
+            nodes = snapshot[node_type] = []
+            with profileSection('collect'):
+                sources = source()
+            for node in sources:
+                with profileSection('snapshot') as section:
+                    record = readNodeSnapshot(node_type, node, plan[node_type])
+                    section.path = record.path
+                nodes.append(record)
+                yield
+
+
+def clearSnapshotCaches():
+    """
+    Drop the CameraInfo and AovTable built from the snapshot, the next check reading them builds them again
+    """
+    camera_infos.clear()
+    aov_tables.clear()
+
+
+def setSnapshot():
+    for _ in iterSnapshot():
+        pass
+
+
+def refreshNodeSnapshot(node_type, node, old_path=None):
+    """
+    Read the planned parms of one node again, replacing its record in the snapshot
+    """
+    nodes = snapshot.setdefault(node_type, [])
+    record = readNodeSnapshot(node_type, node, planParms()[node_type])
+    path = old_path or record.path
+    for i, current in enumerate(nodes):
+        if current.path == path:
+            nodes[i] = record
+            return record
+    nodes.append(record)
+    return record
+
+
+def removeNodeSnapshot(node_type, path):
+    snapshot[node_type] = [node for node in getSnapshot(node_type) if node.path != path]
+
+
+def parmMatches(declared, name):
+    if declared.endswith('*'):
+        index = name[len(declared) - 1:]
+        return name == multiparmCounter(declared) or (name.startswith(declared[:-1]) and index.isdigit())
+    return declared == name
+
+
+def dependentChecks(node_type, parm_names=None):
+    """
+    Registered checks reading any of parm_names from nodes of node_type, or reading anything from them when
+    parm_names is None
+    """
+    found = []
+    for check in getChecks():
+        declared = list(check.nodes.get(node_type, ()))
+        # Camera checks follow the cameras the ROPs render through
+        if node_type == 'Redshift_ROP' and 'cam' in check.nodes:
+            declared.append('RS_renderCamera')
+        if not declared:
+            continue
+        if parm_names is None or any(parmMatches(d, name) for d in declared for name in parm_names):
+            found.append(check)
+    return found
+
+
+class PendingChange(object):
+    """
+    Node events collected for one watched node since the last flush
+    """
+    __slots__ = ('node', 'names', 'old_path', 'deleted')
+
+    def __init__(self, node, old_path):
+        self.node = node
+        self.names = set()
+        self.old_path = old_path
+        self.deleted = False
+
+
+class LiveChecks(object):
+    """
+    Keeps the snapshot current from node event callbacks on the ROPs, render cameras, lights and domes.
+    Events are only collected per node and parm, flush() then reads each changed node once and marks dirty
+    only the checks that read a changed parm, and recompute() runs the dirty checks. on_dirty is called after
+    every event so a scheduler can coalesce them. A node created or deleted in a network that can hold ROPs,
+    lights or cameras marks the scene index stale, and the next flush() walks the scene again and watches the
+    nodes it finds.
+    """
+
+    def __init__(self, on_dirty=None):
+        self.on_dirty = on_dirty
+        self.dirty = set()
+        self.pending = {}
+        self.watched = []
+        self.index = None
+        self.index_stale = False
+
+    def eventTypes(self):
+        return (hou.nodeEventType.ParmTupleChanged, hou.nodeEventType.NameChanged,
+                hou.nodeEventType.BeingDeleted)
+
+    def sources(self):
+        lights, domes = getRsLight()
+        return (('Redshift_ROP', getRopList()), ('rslight', lights), ('rslightdome', domes))
+
+    def start(self):
+        plan = planParms()
+        for node_type, nodes in self.sources() + (('cam', getRenderCams()),):
+            if node_type in plan:
+                for node in nodes:
+                    self.watch(node_type, node)
+        self.watchIndex()
+
+    def stop(self):
+        for node_type, node, callback, path in self.watched:
+            self.unwatch(node, callback)
+        self.watched = []
+        self.pending = {}
+        if self.index is not None:
+            self.index.unwatch(self.childEvent)
+            self.index = None
+
+    def watchIndex(self):
+        self.index = getSceneIndex()
+        self.index.watch(self.childEvent)
+        self.index_stale = False
+
+    def childEvent(self, event_type, node, **kwargs):
+        self.index_stale = True
+        if self.on_dirty is not None:
+            self.on_dirty()
+
+    def reindex(self):
+        """
+        Walk the scene again after nodes were created or deleted, keeping the child events watched. The ROPs,
+        lights and domes are collected again, and each one not watched yet is watched, read into the snapshot
+        and marks the checks reading its type dirty
+        """
+        self.index.unwatch(self.childEvent)
+        if scene_index is self.index:
+            invalidateSceneIndex()
+        self.watchIndex()
+        setRopList()
+        setRsLight()
+
+        plan = planParms()
+        watched = set((node_type, path[0]) for node_type, node, callback, path in self.watched)
+        for node_type, nodes in self.sources():
+            if node_type not in plan:
+                continue
+            for node in nodes:
+                if (node_type, node.path()) not in watched:
+                    self.watch(node_type, node)
+                    refreshNodeSnapshot(node_type, node)
+                    self.dirty.update(check.name for check in dependentChecks(node_type))
+
+        # A new ROP or a created camera one already renders through changes the render cameras, and whether
+        # the checks reading the ROP cameras find them
+        if 'cam' in plan:
+            cams = self.watchedPaths('cam')
+            self.refreshCams()
+            if self.watchedPaths('cam') != cams:
+                self.dirty.update(check.name for check in dependentChecks('Redshift_ROP', ('RS_renderCamera',)))
+
+    def watchedPaths(self, node_type):
+        return sorted(path[0] for watched_type, node, callback, path in self.watched if watched_type == node_type)
+
+    def watch(self, node_type, node):
+        # The path is kept current from NameChanged events, so a watched node never has to be asked for it. HOM
+        # passes callbacks a new hou.Node for every event, the path is what identifies the node
+        path = [node.path()]
+
+        def callback(event_type, node, **kwargs):
+            self.nodeEvent(node_type, path, event_type, node, kwargs.get('parm_tuple'))
+
+        node.addEventCallback(self.eventTypes(), callback)
+        self.watched.append((node_type, node, callback, path))
+
+    def unwatch(self, node, callback):
+        try:
+            node.removeEventCallback(self.eventTypes(), callback)
+        except (hou.ObjectWasDeleted, hou.OperationFailed):
+            pass
+
+    def refreshCams(self):
+        for node_type, node, callback, path in self.watched:
+            if node_type == 'cam':
+                self.unwatch(node, callback)
+        self.watched = [watched for watched in self.watched if watched[0] != 'cam']
+
+        cams = getRenderCams()
+        snapshot['cam'] = [readNodeSnapshot('cam', cam, planParms()['cam']) for cam in cams]
+        for cam in cams:
+            self.watch('cam', cam)
+        self.dirty.update(check.name for check in dependentChecks('cam'))
+
+    def nodeEvent(self, node_type, path, event_type, node, parm_tuple):
+        key = (node_type, path[0])
+        change = self.pending.pop(key, None) or PendingChange(node, path[0])
+
+        if event_type == hou.nodeEventType.BeingDeleted:
+            change.deleted = True
+            self.watched = [watched for watched in self.watched if watched[3] is not path]
+
+        elif event_type == hou.nodeEventType.NameChanged:
+            path[0] = node.path()
+            key = (node_type, path[0])
+            change.names = None
+
+        elif change.names is not None:
+            if parm_tuple is None:
+                change.names = None
+            else:
+                change.names.add(parm_tuple.name())
+                change.names.update(parm.name() for parm in parm_tuple)
+
+        self.pending[key] = change
+        if self.on_dirty is not None:
+            self.on_dirty()
+
+    def flush(self):
+        """
+        Read every node changed since the last flush once and mark the checks reading its changed parms dirty
+        """
+        if self.index_stale:
+            self.reindex()
+        pending = self.pending
+        self.pending = {}
+        cams_changed = False
+        for (node_type, path), change in pending.items():
+            if change.deleted:
+                removeNodeSnapshot(node_type, change.old_path)
+                checks = dependentChecks(node_type)
+            else:
+                checks = dependentChecks(node_type, change.names)
+                if not checks:
+                    continue
+                refreshNodeSnapshot(node_type, change.node, change.old_path)
+                if node_type == 'Redshift_ROP' and (change.names is None or 'RS_renderCamera' in change.names):
+                    cams_changed = True
+            self.dirty.update(check.name for check in checks)
+
+        if cams_changed and 'cam' in planParms():
+            self.refreshCams()
+
+    def recompute(self, budget=None):
+        """
+        Run the dirty checks in registry order, returning (check, result) pairs. With a budget in seconds it
+        stops once the budget is spent, leaving the rest dirty for the next call. A check that fails returns
+        its exception as the result
+        """
+        start = time.perf_counter()
+        results = []
+        for check in getChecks():
+            if check.name not in self.dirty:
+                continue
+            if budget is not None and results and time.perf_counter() - start >= budget:
+                break
+            self.dirty.discard(check.name)
+            # A camera deleted mid-session must not stop the other checks updating
+            try:
+                results.append((check, check.run()))
+            except Exception as e:
+                results.append((check, e))
+        return results
+
+
+def iterChecks():
+    """
+    Collect the scene nodes and run every registered check cooperatively, yielding None after each node read
+    and (check, result) after each check. A check that fails yields its exception as the result
+    """
+    invalidateSceneIndex()
+    with profileSection('collect'):
+        setRopList()
+        setRsLight()
+    yield None
+    for step in iterSnapshot():
+        yield None
+
+    for check in getChecks():
+        with profileSection(check.name):
+            try:
+                result = check.run()
+            except Exception as e:
+                log.error("[Preflight]%s failed", check.name, exc_info=True)
+                result = e
+        yield check, result
+
+
+def runChecks(new_scene=None):
+    """
+    Collect the scene nodes and run every registered check, returning the results keyed by check name. A
+    check that fails has its exception as its result, the other checks still run. new_scene replaces the
+    hou session as the source of nodes, e.g. an offline hipfile.HipFile
+    """
+    if new_scene is not None:
+        setScene(new_scene)
+    results = {}
+    for step in iterChecks():
+        if step is not None:
+            check, result = step
+            results[check.name] = result
+    return results
+
+
+class Finding(object):
+    """
+    One line a check reports, a message key with its values on a node rather than formatted text, so the
+    window, the batch results and the gates filter and count them without parsing. The text is only
+    formatted when a line is shown or written
+    """
+    __slots__ = ('check', 'severity', 'path', 'key', 'values')
+
+    def __init__(self, check, severity, path, key, values=None):
+        self.check = check
+        self.severity = severity
+        self.path = path
+        self.key = key
+        self.values = values
+
+    def text(self):
+        values = self.values or {}
+        return MESSAGES[self.key].format(name=self.path.rsplit('/', 1)[-1], path=self.path,
+                                         frames=spanText(values.get('start'), values.get('end')), **values)
+
+    def toJson(self):
+        return {
+            'check': self.check,
+            'severity': SEVERITY_NAMES[self.severity],
+            'path': self.path,
+            'key': self.key,
+            'values': self.values or {},
+            'message': self.text(),
+        }
+
+
+def spanValues(start, end):
+    """
+    Finding values of a span of frames from parmSpans(), None for the span of a static parm
+    """
+    if start is None:
+        return None
+    return {'start': float(start), 'end': float(end)}
+
+
+def iterFindings(result):
+    """
+    Every Finding of a check result, however the check nests them
+    """
+    if isinstance(result, Finding):
+        yield result
+    elif isinstance(result, (list, tuple)):
+        for item in result:
+            for finding in iterFindings(item):
+                yield finding
+
+
+def worstSeverity(results):
+    """
+    Highest severity of the findings in runChecks() results, None when no check reported one. A check that
+    failed counts as an error
+    """
+    worst = None
+    for result in results.values():
+        if isinstance(result, Exception):
+            worst = SEVERITY_ERROR
+            continue
+        for finding in iterFindings(result):
+            if worst is None or finding.severity > worst:
+                worst = finding.severity
+    return worst
+
+
+def resultJson(result):
+    if isinstance(result, Finding):
+        return result.toJson()
+    if isinstance(result, Exception):
+        return {'error': '{t}: {e}'.format(t=type(result).__name__, e=result)}
+    if isinstance(result, (list, tuple)):
+        return [resultJson(item) for item in result]
+    return result
+
+
+def resultsJson(results):
+    """
+    runChecks() results with every Finding as a dict, ready for json.dump()
+    """
+    return {name: resultJson(result) for name, result in results.items()}
+
+
+# Display lines of a check result are (text, severity) pairs, with a None severity for plain values
+def valueDisplay(result):
+    value, findings = result
+    return [(value, None)] + findingDisplay(findings)
+
+
+def findingDisplay(findings):
+    return [(finding.text(), finding.severity) for finding in findings]
+
+
+def cameraDisplay(text):
+    """
+    Display of a camera check, the default camera's value formatted by text then its findings
+    """
+    def display(result):
+        value, findings = result
+        lines = [(text(value), None)] if value is not None else []
+        return lines + findingDisplay(findings)
+    return display
+
+
+# Check Rop Cameras
+@registerCheck('Camera Settings', 'Render Camera:', {'Redshift_ROP': ('RS_renderCamera',)},
+               display=valueDisplay)
+def cameraInfo():
+    groups, default = cameraGroups(getSnapshot('Redshift_ROP'))
+    setDefaultCam(default)
+    log.info("[CameraInfo]Default Cam set to %s", default)
+
+    # One line per other camera, scenes rendering several cameras on purpose get one group each
+    index = getSceneIndex()
+    info = []
+    if not groups:
+        info.append(Finding('cameraInfo', SEVERITY_ERROR, '', 'rops_missing'))
+    for cam, rops in groups.items():
+        log.debug("[CameraInfo]%s rendered by %s ROPs", cam, len(rops))
+        if index.node(cam) is None:
+            info.append(Finding('cameraInfo', SEVERITY_ERROR, cam, 'camera_missing', {'rops': ', '.join(rops)}))
+        elif cam != default:
+            info.append(Finding('cameraInfo', SEVERITY_WARNING, cam, 'camera_rendered_by', {'rops': ', '.join(rops)}))
+
+    return default, info
+
+
+@registerCheck('Camera Settings', 'Camera Resolution:', {'cam': ('res',)},
+               display=cameraDisplay(lambda res: '{x} x {y}'.format(x=res[0], y=res[1])))
+def resolution():
+    res, findings = cameraFindings('resolution', 'res', lambda res: 'camera_resolution')
+    if res is not None:
+        log.info("[CamerInfo]Resolution %s x %s", res[0], res[1])
+    return res, findings
+
+
+@registerCheck('Camera Settings', 'Pixel Aspect Ratio:', {'cam': ('aspect',)}, display=cameraDisplay(str))
+def pixelRatio():
+    pixel, findings = cameraFindings('pixelRatio', 'aspect', lambda pixel: 'camera_aspect',
+                                     invalid=lambda pixel: float(pixel) > 2, invalid_key='camera_aspect_invalid')
+    log.info("[CamerInfo]Pixel Aspect Ratio %s", pixel)
+    return pixel, findings
+
+
+@registerCheck('Camera Settings', 'Camera DOF:', {'cam': ('RS_campro_dofEnable',)},
+               display=cameraDisplay(lambda dof: 'DOF Enabled' if dof > 0 else 'DOF Disabled'))
+def dof():
+    dof, findings = cameraFindings('dof', 'dof',
+                                   lambda dof: 'camera_dof_enabled' if dof > 0 else 'camera_dof_disabled')
+    log.info("[CamerInfo]Camera DOF %s", dof)
+    return dof, findings
+
+
+@registerCheck('Camera Settings', 'Clip Planes:', {'cam': ('near', 'far')},
+               display=cameraDisplay(lambda clip: '{n} - {f}'.format(n=clip[0], f=clip[1])))
+def clipPlanes():
+    clip, findings = cameraFindings('clipPlanes', 'clip', lambda clip: 'camera_clip')
+    if clip is not None:
+        log.info("[CamerInfo]Clip Planes %s - %s", clip[0], clip[1])
+    return clip, findings
+
+
+@registerCheck('Camera Settings', 'Frame Range:', {'Redshift_ROP': ('f1', 'f2')}, display=valueDisplay)
+def frameRange():
+    range = getScene().playbackRange()
+    f_frame = range[0]
+    l_frame = range[1]
+    rops = getSnapshot('Redshift_ROP')
+    warning = []
+    frames = "{f} - {l}".format(f=f_frame, l=l_frame)
+    for rop in rops:
+        rop_fFrame = rop.eval("f1")
+        rop_lFrame = rop.eval("f2")
+        if rop_fFrame != f_frame or rop_lFrame != l_frame:
+            warning.append(Finding('frameRange', SEVERITY_WARNING, rop.path, 'frame_range',
+                                   {'first': rop_fFrame, 'last': rop_lFrame}))
+
+    return frames, warning
+
+
+@registerCheck('AOV Settings', 'AOV ROP Status:', {'Redshift_ROP': ('RS_aov', 'RS_aovEnable_*')},
+               display=findingDisplay)
+def aovs():
+    # Only enabled AOVs count, a ROP whose AOVs are all switched off by RS_aovEnable_* renders none of them
+    rops = getSnapshot('Redshift_ROP')
+    warnings = []
+    for rop in rops:
+        aovListLength = len(getAovTable(rop).enabled())
+        if aovListLength <= 0:
+            warnings.append(Finding('aovs', SEVERITY_ERROR, rop.path, 'aovs_missing'))
+        else:
+            continue
+    return warnings
+
+
+@registerCheck(nodes={'Redshift_ROP': ('RS_aovDeepEnabled',)})
+def zDepth():
+    rops = getSnapshot('Redshift_ROP')
+    findings = []
+    debug = log.isEnabledFor(DEBUG)
+    for rop in rops:
+        z_depth = rop.eval("RS_aovDeepEnabled")
+        if debug:
+            log.debug("[ROP INFO]%s ZDepth %s", rop.name, z_depth)
+        if z_depth <= 0:
+            findings.append(Finding('zDepth', SEVERITY_WARNING, rop.path, 'zdepth_disabled'))
+        else:
+            continue
+    return findings
+
+
+def motionVector(rop):
+    if getAovTable(rop).hasId(AOV_MOTION_VECTORS):
+        check = 1
+    else:
+        check = 0
+    return check
+
+
+def motionBlur(moblur):
+    if moblur == 1:
+        check = 1
+    else:
+        check = 0
+    return check
+
+
+@registerCheck('AOV Settings', 'Motion Status:',
+               {'Redshift_ROP': ('RS_aovID_*', 'RS_aovEnable_*', 'MotionBlurEnabled')},
+               display=findingDisplay)
+def motionCheck():
+    rops = getSnapshot('Redshift_ROP')
+    findings = []
+    for rop in rops:
+        mo_Vector = motionVector(rop)
+        for start, end, moblur in parmSpans(rop, 'MotionBlurEnabled'):
+            mo_blur = motionBlur(moblur)
+            if mo_Vector >= 1 and mo_blur >= 1:
+                key, severity = 'motion_blur_vector', SEVERITY_ERROR
+            elif mo_blur >= 1:
+                key, severity = 'motion_blur', SEVERITY_INFO
+            elif mo_Vector >= 1:
+                key, severity = 'motion_vector', SEVERITY_INFO
+            else:
+                # Neither is on over these frames, nothing to report
+                continue
+            findings.append(Finding('motionCheck', severity, rop.path, key, spanValues(start, end)))
+    return findings
+
+
+@registerCheck('AOV Settings', 'GI Status:', {'Redshift_ROP': ('RS_GIEnabled',)}, display=findingDisplay)
+def gi():
+    rops = getSnapshot('Redshift_ROP')
+    findings = []
+    for rop in rops:
+        for start, end, rs_gi in parmSpans(rop, 'RS_GIEnabled'):
+            if rs_gi >= 1:
+                finding = Finding('gi', SEVERITY_INFO, rop.path, 'gi_enabled', spanValues(start, end))
+            else:
+                finding = Finding('gi', SEVERITY_ERROR, rop.path, 'gi_disabled', spanValues(start, end))
+            findings.append(finding)
+    return findings
+
+
+@registerCheck('AOV Settings', 'Crypto AOV Status:', {'Redshift_ROP': ('RS_aovSuffix_*', 'RS_aovEnable_*')},
+               display=findingDisplay)
+def crypto():
+    # A crypto AOV that is switched off by RS_aovEnable_* counts as missing, it is not rendered
+    rops = getSnapshot('Redshift_ROP')
+    findings = []
+
+    for rop in rops:
+        table = getAovTable(rop)
+        crymat = table.hasSuffix('U_CRYMAT_matte')
+        cryobj = table.hasSuffix('U_CRYOBJ_matte')
+        if not crymat and not cryobj:
+            findings.append(Finding('crypto', SEVERITY_WARNING, rop.path, 'crypto_missing'))
+
+        elif not crymat:
+            findings.append(Finding('crypto', SEVERITY_WARNING, rop.path, 'crypto_matte_missing'))
+
+        elif not cryobj:
+            findings.append(Finding('crypto', SEVERITY_WARNING, rop.path, 'crypto_obj_missing'))
+
+    return findings
+
+
+@registerCheck('Light Settings', 'Dome Status:',
+               {'rslightdome': ('background_enable', 'backPlateEnabled')}, display=findingDisplay)
+def checklights():
+    domes = getSnapshot('rslightdome')
+    findings = []
+    for dome in domes:
+        domeblackdrop = dome.eval('background_enable')
+        domebackplate = dome.eval('backPlateEnabled')
+        # Dome versions without one of the toggles read it as None and get no line for it
+        if domeblackdrop is not None and domeblackdrop >= 1:
+            findings.append(Finding('checklights', SEVERITY_INFO, dome.path, 'dome_background_on'))
+        if domeblackdrop is not None and domeblackdrop <= 0:
+            findings.append(Finding('checklights', SEVERITY_INFO, dome.path, 'dome_background_off'))
+        if domebackplate is not None and domebackplate >= 1:
+            findings.append(Finding('checklights', SEVERITY_INFO, dome.path, 'dome_backplate_on'))
+        if domebackplate is not None and domebackplate <= 0:
+            findings.append(Finding('checklights', SEVERITY_INFO, dome.path, 'dome_backplate_off'))
+
+    return findings
+
+
+@registerCheck('AOV Settings', 'RS ENV Status:', {'Redshift_ROP': ('RS_globalEnvironment',)},
+               display=findingDisplay)
+def rsEnv():
+    rops = getSnapshot('Redshift_ROP')
+    findings = []
+    for rop in rops:
+        rs_env = rop.eval('RS_globalEnvironment')
+
+        # ROPs of a Redshift version without the parm read None, which says nothing about the environment
+        if rs_env is None:
+            findings.append(Finding('rsEnv', SEVERITY_WARNING, rop.path, 'rs_env_unknown'))
+        elif rs_env != '':
+            findings.append(Finding('rsEnv', SEVERITY_INFO, rop.path, 'rs_env_enabled'))
+        else:
+            continue
+    return findings
+
+
+@registerCheck()
+def saveStatus():
+    hip_name = getScene().hipName()
+    save_check = getScene().hasUnsavedChanges()
+    if save_check:
+        status = Finding('saveStatus', SEVERITY_ERROR, hip_name, 'file_not_saved')
+    else:
+        status = Finding('saveStatus', SEVERITY_INFO, hip_name, 'file_saved')
+
+    return hip_name, status
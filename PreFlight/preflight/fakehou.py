@@ -0,0 +1,869 @@
+"""
+In-memory hou
+A working stand-in for the part of the hou module preflight uses, so the checks, the live mode and the
+benchmarks run on a plain Python install. Nodes live in one in-memory session with /obj and /out networks,
+carry the parms of their type with Houdini's defaults, and send the node events the live mode listens to.
+
+Usage
+    from preflight import fakehou
+    fakehou.install()
+    fakehou.buildScene(rops=200, aovs=16, cams=3, domes=1)
+
+    from preflight import core
+    results = core.runChecks()
+
+install() registers this module as hou in sys.modules, so it must run before preflight.core is imported
+when no real hou is available. buildScene() replaces the current session with a generated scene.
+"""
+
+import ast
+import fnmatch
+import operator
+import os
+import re
+import sys
+
+from preflight.hipfile import EXPRESSION_OPERATORS
+
+# Parm tuples of every node type, (tuple name, component names, defaults). Single parms are one component
+# tuples named like the parm, as in Houdini
+NODE_TYPES = {
+    'Redshift_ROP': ('Driver', (
+        ('f', ('f1', 'f2', 'f3'), (1.0, 240.0, 1.0)),
+        ('RS_renderCamera', ('RS_renderCamera',), ('/obj/cam1',)),
+        ('RS_aov', ('RS_aov',), (0,)),
+        ('RS_aovDeepEnabled', ('RS_aovDeepEnabled',), (0,)),
+        ('RS_GIEnabled', ('RS_GIEnabled',), (1,)),
+        ('MotionBlurEnabled', ('MotionBlurEnabled',), (0,)),
+        ('RS_globalEnvironment', ('RS_globalEnvironment',), ('',)),
+    )),
+    'cam': ('Object', (
+        ('res', ('resx', 'resy'), (1920, 1080)),
+        ('aspect', ('aspect',), (1.0,)),
+        ('RS_campro_dofEnable', ('RS_campro_dofEnable',), (0,)),
+        ('near', ('near',), (0.001,)),
+        ('far', ('far',), (10000.0,)),
+    )),
+    'rslight': ('Object', (
+        ('light_type', ('light_type',), (0,)),
+        ('RSL_intensityMultiplier', ('RSL_intensityMultiplier',), (1.0,)),
+    )),
+    'rslightdome::2.0': ('Object', (
+        ('background_enable', ('background_enable',), (1,)),
+        ('backPlateEnabled', ('backPlateEnabled',), (0,)),
+    )),
+    'geo': ('Object', ()),
+    'subnet': ('Object', ()),
+    'ropnet': ('Object', ()),
+    'null': ('Sop', ()),
+}
+
+# Category of the children of every network type, types missing here hold no children
+CHILD_CATEGORIES = {
+    'root': 'Manager',
+    'obj': 'Object',
+    'out': 'Driver',
+    'geo': 'Sop',
+    'subnet': 'Object',
+    'ropnet': 'Driver',
+}
+
+# Parms of one multiparm instance, keyed on the counter parm. # is replaced by the 1 based instance number
+MULTIPARM_TEMPLATES = {
+    'RS_aov': (
+        ('RS_aovEnable_#', 1),
+        ('RS_aovID_#', 0),
+        ('RS_aovSuffix_#', ''),
+        ('RS_aovDataType_#', 0),
+        ('RS_aovCustomPrefix_#', ''),
+    ),
+}
+
+# Tokens of the RS_aovID menu, opparm prints the token and HOM evaluates to its index
+AOV_ID_TOKENS = (
+    'custom', 'cryptomatte', 'motionvectors', 'depth', 'diffuselighting', 'specularlighting', 'reflections',
+    'refractions', 'emission', 'sss', 'volumelighting', 'caustics', 'gi', 'shadows', 'normals', 'worldposition',
+)
+
+# (parm template type, menu tokens) of the parm tuples whose default does not tell their type, the others are
+# Int, Float or String templates like their default. Multiparm instance parms are named as in their template
+PARM_TEMPLATES = {
+    'RS_aov': ('Folder', ()),
+    'RS_aovDeepEnabled': ('Toggle', ()),
+    'RS_GIEnabled': ('Toggle', ()),
+    'MotionBlurEnabled': ('Toggle', ()),
+    'RS_campro_dofEnable': ('Toggle', ()),
+    'background_enable': ('Toggle', ()),
+    'backPlateEnabled': ('Toggle', ()),
+    'RS_aovEnable_#': ('Toggle', ()),
+    'RS_aovID_#': ('Menu', AOV_ID_TOKENS),
+    'light_type': ('Menu', ('area', 'point', 'spot', 'directional')),
+}
+
+# Parm template types evaluating to an int
+INT_TEMPLATES = ('Int', 'Toggle', 'Menu', 'Folder')
+
+# (RS_aovID menu index, suffix) of the AOVs buildScene adds, in order. Index 2 is motion vectors as
+# preflight.core reads it
+SCENE_AOVS = (
+    (1, 'U_CRYMAT_matte'),
+    (1, 'U_CRYOBJ_matte'),
+    (2, 'MotionVectors'),
+    (3, 'Z'),
+    (4, 'diffuse_lighting'),
+    (5, 'specular_lighting'),
+    (6, 'reflections'),
+    (7, 'refractions'),
+    (8, 'emission'),
+    (9, 'sss'),
+    (10, 'volume_lighting'),
+    (11, 'caustics'),
+    (12, 'gi'),
+    (13, 'shadows'),
+    (14, 'normals'),
+    (15, 'world_position'),
+)
+
+# Camera resolutions buildScene cycles through
+SCENE_RESOLUTIONS = ((1920, 1080), (2048, 858), (3840, 2160), (1280, 720))
+
+
+class ObjectWasDeleted(Exception):
+    pass
+
+
+class OperationFailed(Exception):
+    pass
+
+
+class KeyframeValueNotSet(Exception):
+    pass
+
+
+class EnumValue(object):
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+    def __repr__(self):
+        return '<hou.EnumValue {name}>'.format(name=self._name)
+
+
+class parmTemplateType(object):
+    Int = EnumValue('Int')
+    Float = EnumValue('Float')
+    String = EnumValue('String')
+    Toggle = EnumValue('Toggle')
+    Menu = EnumValue('Menu')
+    Folder = EnumValue('Folder')
+
+
+class ParmTemplate(object):
+    def __init__(self, name, type_name, menu_items):
+        self._name = name
+        self._type = getattr(parmTemplateType, type_name)
+        self._menu_items = menu_items
+
+    def name(self):
+        return self._name
+
+    def type(self):
+        return self._type
+
+    def menuItems(self):
+        return self._menu_items
+
+
+def parmTemplate(name, defaults):
+    type_name, menu_items = PARM_TEMPLATES.get(name, (None, ()))
+    if type_name is None:
+        type_name = 'String' if isinstance(defaults[0], str) else 'Float' if isinstance(defaults[0], float) else 'Int'
+    return ParmTemplate(name, type_name, menu_items)
+
+
+class nodeEventType(object):
+    ParmTupleChanged = 'ParmTupleChanged'
+    NameChanged = 'NameChanged'
+    BeingDeleted = 'BeingDeleted'
+    ChildCreated = 'ChildCreated'
+    ChildDeleted = 'ChildDeleted'
+
+
+class NodeTypeCategory(object):
+    def __init__(self, name):
+        self._name = name
+
+    def name(self):
+        return self._name
+
+    def nodeType(self, type_name):
+        node_type = NODE_TYPES.get(type_name)
+        if node_type is None or node_type[0] != self._name:
+            return None
+        return NodeType(self, type_name)
+
+
+class NodeType(object):
+    def __init__(self, category, type_name):
+        self._category = category
+        self._name = type_name
+
+    def name(self):
+        return self._name
+
+    def category(self):
+        return self._category
+
+    def nameWithCategory(self):
+        return '{category}/{name}'.format(category=self._category.name(), name=self._name)
+
+    def instances(self):
+        return tuple(session.instances.get(self._name, ()))
+
+
+# Frame variable of a keyframe expression, not the start of $FPS
+FRAME_VARIABLE_RE = re.compile(r'\$F(?![A-Z])')
+
+# Interpolation a key without an expression gets, as in Houdini
+DEFAULT_SEGMENT = 'bezier()'
+
+
+def smoothstep(blend):
+    return blend * blend * (3.0 - 2.0 * blend)
+
+
+# Share of the way from a key's value to the next key's value the interpolation functions are at, by the share
+# of the segment's frames passed. Tangents are not modelled, ease, cubic and bezier all stand in as smoothsteps
+SEGMENT_FUNCTIONS = {
+    'constant': lambda blend: 0.0,
+    'linear': lambda blend: blend,
+    'ease': smoothstep,
+    'easep': smoothstep,
+    'easein': lambda blend: blend * blend,
+    'easeinp': lambda blend: blend * blend,
+    'easeout': lambda blend: 1.0 - (1.0 - blend) ** 2,
+    'easeoutp': lambda blend: 1.0 - (1.0 - blend) ** 2,
+    'cubic': smoothstep,
+    'bezier': smoothstep,
+}
+
+# Operators of segment expressions, comparisons evaluate to 1 or 0 like in hscript
+SEGMENT_OPERATORS = dict(EXPRESSION_OPERATORS)
+SEGMENT_OPERATORS.update({
+    ast.Mod: operator.mod,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+})
+
+
+def evalSegmentNode(node, start, end, blend):
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return float(node.value)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        value = evalSegmentNode(node.operand, start, end, blend)
+        return -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, ast.BinOp) and type(node.op) in SEGMENT_OPERATORS:
+        return SEGMENT_OPERATORS[type(node.op)](evalSegmentNode(node.left, start, end, blend),
+                                                evalSegmentNode(node.right, start, end, blend))
+    if isinstance(node, ast.Compare) and len(node.ops) == 1 and type(node.ops[0]) in SEGMENT_OPERATORS:
+        return float(SEGMENT_OPERATORS[type(node.ops[0])](evalSegmentNode(node.left, start, end, blend),
+                                                          evalSegmentNode(node.comparators[0], start, end, blend)))
+    if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id in SEGMENT_FUNCTIONS:
+        return start + (end - start) * SEGMENT_FUNCTIONS[node.func.id](blend)
+    raise OperationFailed('Unsupported keyframe expression')
+
+
+class Keyframe(object):
+    """
+    A key with the expression of the segment it starts, bezier() when none is set. The interpolation functions
+    move from the key's value to the next key's, see SEGMENT_FUNCTIONS, and combine with $F, numbers,
+    arithmetic and comparisons
+    """
+
+    def __init__(self, value=None):
+        self._frame = 1.0
+        self._value = value
+        self._expression = None
+
+    def frame(self):
+        return self._frame
+
+    def setFrame(self, frame):
+        self._frame = float(frame)
+
+    def value(self):
+        return self._value
+
+    def setValue(self, value):
+        self._value = value
+
+    def isExpressionSet(self):
+        return self._expression is not None
+
+    def expression(self):
+        if self._expression is None:
+            raise KeyframeValueNotSet()
+        return self._expression
+
+    def setExpression(self, expression, language=None):
+        self._expression = expression
+
+    def evalSegment(self, frame, next_key):
+        expression = (self._expression or DEFAULT_SEGMENT).strip()
+        if expression == 'constant()':
+            return self._value
+        end = self._value
+        blend = 0.0
+        if next_key is not None and next_key.frame() != self._frame:
+            end = next_key.value()
+            blend = (frame - self._frame) / (next_key.frame() - self._frame)
+        try:
+            tree = ast.parse(FRAME_VARIABLE_RE.sub(repr(float(frame)), expression), mode='eval')
+        except SyntaxError:
+            raise OperationFailed('Bad keyframe expression')
+        return evalSegmentNode(tree.body, self._value, end, blend)
+
+
+class Parm(object):
+    """
+    A parm holding one value, or keyframes evaluated by the expression of the segment a frame falls in.
+    Parms of int, toggle and menu templates round what their keys evaluate to
+    """
+
+    def __init__(self, parm_tuple, name, value):
+        self._tuple = parm_tuple
+        self._name = name
+        self.value = value
+        self.keys = []
+
+    def name(self):
+        return self._name
+
+    def node(self):
+        return self._tuple.node()
+
+    def tuple(self):
+        return self._tuple
+
+    def parmTemplate(self):
+        return self._tuple.parmTemplate()
+
+    def eval(self):
+        self._tuple.node().checkAlive()
+        if self.keys:
+            return self.evalAtFrame(session.frame)
+        return self.value
+
+    def evalAtFrame(self, frame):
+        self._tuple.node().checkAlive()
+        if not self.keys:
+            return self.value
+        if frame < self.keys[0].frame():
+            return self.keys[0].value()
+        index = 0
+        while index + 1 < len(self.keys) and self.keys[index + 1].frame() <= frame:
+            index += 1
+        next_key = self.keys[index + 1] if index + 1 < len(self.keys) else None
+        value = self.keys[index].evalSegment(frame, next_key)
+        if isinstance(value, float) and self._tuple.parmTemplate().type().name() in INT_TEMPLATES:
+            return int(round(value))
+        return value
+
+    def isTimeDependent(self):
+        return bool(self.keys)
+
+    def keyframes(self):
+        return tuple(self.keys)
+
+    def setKeyframe(self, keyframe):
+        node = self._tuple.node()
+        node.checkAlive()
+        self.keys = [key for key in self.keys if key.frame() != keyframe.frame()] + [keyframe]
+        self.keys.sort(key=lambda key: key.frame())
+        session.unsaved = True
+        node.sendEvent(nodeEventType.ParmTupleChanged, parm_tuple=self._tuple)
+
+    def deleteAllKeyframes(self):
+        self.keys = []
+        session.unsaved = True
+        self._tuple.node().sendEvent(nodeEventType.ParmTupleChanged, parm_tuple=self._tuple)
+
+    def evalAsInt(self):
+        return int(self.eval())
+
+    def evalAsFloat(self):
+        return float(self.eval())
+
+    def evalAsString(self):
+        return str(self.eval())
+
+    def set(self, value):
+        node = self._tuple.node()
+        node.checkAlive()
+        self.value = value
+        if self._name in MULTIPARM_TEMPLATES:
+            node.resizeMultiparm(self._name, int(value))
+        session.unsaved = True
+        node.sendEvent(nodeEventType.ParmTupleChanged, parm_tuple=self._tuple)
+
+
+class ParmTuple(object):
+    def __init__(self, node, name, components, defaults, template):
+        self._node = node
+        self._name = name
+        self._template = template
+        self.parms = [Parm(self, component, value) for component, value in zip(components, defaults)]
+
+    def name(self):
+        return self._name
+
+    def node(self):
+        return self._node
+
+    def parmTemplate(self):
+        return self._template
+
+    def __iter__(self):
+        return iter(self.parms)
+
+    def __len__(self):
+        return len(self.parms)
+
+    def __getitem__(self, index):
+        return self.parms[index]
+
+    def eval(self):
+        return tuple(parm.eval() for parm in self.parms)
+
+    def evalAtFrame(self, frame):
+        return tuple(parm.evalAtFrame(frame) for parm in self.parms)
+
+    def set(self, values):
+        for parm, value in zip(self.parms, values):
+            parm.value = value
+        session.unsaved = True
+        self._node.sendEvent(nodeEventType.ParmTupleChanged, parm_tuple=self)
+
+
+class Node(object):
+    def __init__(self, parent, name, type_name):
+        self._parent = parent
+        self._name = name
+        self._type = type_name
+        self._children = {}
+        self._tuples = {}
+        self._parms = {}
+        self._callbacks = []
+        self._deleted = False
+        for tuple_name, components, defaults in NODE_TYPES.get(type_name, ('', ()))[1]:
+            self.addParmTuple(tuple_name, components, defaults)
+
+    def __str__(self):
+        return self._name
+
+    def __repr__(self):
+        return '<hou.Node {path}>'.format(path=self.path())
+
+    def checkAlive(self):
+        if self._deleted:
+            raise ObjectWasDeleted('Attempt to access an object that no longer exists in Houdini.')
+
+    def addParmTuple(self, name, components, defaults, template_name=None):
+        template = parmTemplate(template_name or name, defaults)
+        parm_tuple = ParmTuple(self, name, components, defaults, template)
+        self._tuples[name] = parm_tuple
+        for parm in parm_tuple:
+            self._parms[parm.name()] = parm
+        return parm_tuple
+
+    def removeParmTuple(self, name):
+        for parm in self._tuples.pop(name):
+            del self._parms[parm.name()]
+
+    def resizeMultiparm(self, counter, count):
+        template = MULTIPARM_TEMPLATES[counter]
+        current = 0
+        while template[0][0].replace('#', str(current + 1)) in self._tuples:
+            current += 1
+        for index in range(current, count):
+            for template_name, default in template:
+                name = template_name.replace('#', str(index + 1))
+                self.addParmTuple(name, (name,), (default,), template_name)
+        for index in range(count, current):
+            for name, default in template:
+                self.removeParmTuple(name.replace('#', str(index + 1)))
+
+    def name(self):
+        self.checkAlive()
+        return self._name
+
+    def path(self):
+        self.checkAlive()
+        if self._parent is None:
+            return '/'
+        parent = self._parent.path()
+        return parent.rstrip('/') + '/' + self._name
+
+    def parent(self):
+        return self._parent
+
+    def type(self):
+        type_name = self._type
+        category = NODE_TYPES.get(type_name, ('Manager',))[0]
+        return NodeType(NodeTypeCategory(category), type_name)
+
+    def childTypeCategory(self):
+        category = CHILD_CATEGORIES.get(self._type)
+        return NodeTypeCategory(category) if category is not None else None
+
+    def children(self):
+        self.checkAlive()
+        return tuple(self._children.values())
+
+    def allSubChildren(self, top_down=True, recurse_in_locked_nodes=True):
+        found = []
+        for child in self.children():
+            found.append(child)
+            found.extend(child.allSubChildren())
+        return tuple(found)
+
+    def node(self, path):
+        if path.startswith('/'):
+            return node(path)
+        current = self
+        for name in path.split('/'):
+            if name in ('', '.'):
+                continue
+            current = current._parent if name == '..' else current._children.get(name)
+            if current is None:
+                return None
+        return current
+
+    def parm(self, name):
+        self.checkAlive()
+        return self._parms.get(name)
+
+    def parms(self):
+        self.checkAlive()
+        return tuple(self._parms.values())
+
+    def parmTuple(self, name):
+        self.checkAlive()
+        return self._tuples.get(name)
+
+    def globParms(self, pattern):
+        self.checkAlive()
+        patterns = pattern.split()
+        return tuple(parm for name, parm in self._parms.items()
+                     if any(fnmatch.fnmatchcase(name, p) for p in patterns))
+
+    def parmTuples(self):
+        self.checkAlive()
+        return tuple(self._tuples.values())
+
+    def createNode(self, type_name, node_name=None):
+        self.checkAlive()
+        if node_name is None:
+            base = type_name.split('::')[0]
+            index = 1
+            while base + str(index) in self._children:
+                index += 1
+            node_name = base + str(index)
+        elif node_name in self._children:
+            raise OperationFailed('Node name already in use')
+
+        child = Node(self, node_name, type_name)
+        self._children[node_name] = child
+        session.instances.setdefault(type_name, []).append(child)
+        session.unsaved = True
+        self.sendEvent(nodeEventType.ChildCreated, child_node=child)
+        return child
+
+    def setName(self, name):
+        self.checkAlive()
+        if name == self._name:
+            return
+        if name in self._parent._children:
+            raise OperationFailed('Node name already in use')
+        del self._parent._children[self._name]
+        self._name = name
+        self._parent._children[name] = self
+        session.unsaved = True
+        self.sendEvent(nodeEventType.NameChanged)
+
+    def destroy(self):
+        self.checkAlive()
+        for child in self.children():
+            child.destroy()
+        self.sendEvent(nodeEventType.BeingDeleted)
+        parent = self._parent
+        del parent._children[self._name]
+        session.instances[self._type].remove(self)
+        self._deleted = True
+        session.unsaved = True
+        parent.sendEvent(nodeEventType.ChildDeleted, child_node=self)
+
+    def addEventCallback(self, event_types, callback):
+        self.checkAlive()
+        self._callbacks.append((tuple(event_types), callback))
+
+    def removeEventCallback(self, event_types, callback):
+        self.checkAlive()
+        for registered in self._callbacks:
+            if registered[1] == callback:
+                self._callbacks.remove(registered)
+                return
+        raise OperationFailed('Callback not found')
+
+    def eventCallbacks(self):
+        return tuple(self._callbacks)
+
+    def sendEvent(self, event_type, **kwargs):
+        for event_types, callback in list(self._callbacks):
+            if event_type in event_types:
+                callback(event_type=event_type, node=NodeHandle(self), **kwargs)
+
+
+class NodeHandle(object):
+    """
+    Another hou.Node for the same node, as HOM passes a new one to every event callback. Handles compare
+    equal to the node but are never the same object
+    """
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+        self._node = node
+
+    def __getattr__(self, name):
+        return getattr(self._node, name)
+
+    def __eq__(self, other):
+        return self._node is getattr(other, '_node', other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return id(self._node)
+
+    def __str__(self):
+        return str(self._node)
+
+    def __repr__(self):
+        return repr(self._node)
+
+
+class Session(object):
+    """
+    The nodes, playbar and hip file state of one fake Houdini session
+    """
+
+    def __init__(self):
+        self.root = Node(None, '', 'root')
+        self.instances = {}
+        self.root._children['obj'] = Node(self.root, 'obj', 'obj')
+        self.root._children['out'] = Node(self.root, 'out', 'out')
+        self.playback_range = (1.0, 240.0)
+        self.frame = 1.0
+        self.hip_path = os.path.join(os.getcwd(), 'untitled.hip')
+        self.unsaved = False
+
+
+session = Session()
+
+# Scene builders hipFile.load() runs in place of reading a file, keyed on the hip path
+HIP_SCENES = {}
+
+
+def node(path):
+    current = session.root
+    for name in path.split('/'):
+        if name:
+            current = current._children.get(name)
+            if current is None:
+                return None
+    return current
+
+
+def root():
+    return session.root
+
+
+def ropNodeTypeCategory():
+    return NodeTypeCategory('Driver')
+
+
+def objNodeTypeCategory():
+    return NodeTypeCategory('Object')
+
+
+def isUIAvailable():
+    return False
+
+
+def frame():
+    return session.frame
+
+
+def setFrame(frame):
+    session.frame = float(frame)
+
+
+def hscriptValue(value, template):
+    """
+    A value as opparm prints it, toggles as on or off and menus as the token of their item
+    """
+    type_name = template.type().name()
+    if type_name == 'Toggle':
+        return 'on' if value else 'off'
+    if type_name == 'Menu':
+        value = template.menuItems()[value]
+    text = repr(value) if isinstance(value, float) else str(value)
+    if text and not any(c.isspace() or c in '\'"`()' for c in text):
+        return text
+    return "'" + text.replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+
+def hscript(command):
+    """
+    Runs opparm -d, the one hscript command preflight sends, returning (output, errors) like hou.hscript()
+    """
+    args = command.split()
+    if args[:2] != ['opparm', '-d'] or len(args) < 3:
+        return '', 'Unknown command: {command}\n'.format(command=command)
+    target = node(args[2])
+    if target is None:
+        return '', 'Bad node: {path}\n'.format(path=args[2])
+
+    path = target.path()
+    channels = []
+    dumped = []
+    for parm_tuple in target._tuples.values():
+        names = [parm_tuple.name()] + [parm.name() for parm in parm_tuple]
+        if any(fnmatch.fnmatchcase(name, p) for name in names for p in args[3:]):
+            template = parm_tuple.parmTemplate()
+            values = ' '.join(hscriptValue(value, template) for value in parm_tuple.eval())
+            dumped.append('{name} ( {values} )'.format(name=parm_tuple.name(), values=values))
+            channels.extend(parm.name() for parm in parm_tuple if parm.keys)
+    lines = ['chadd -t 0 0 {path} {name}\n'.format(path=path, name=name) for name in channels]
+    lines.append('opparm -V 20.0 {path} {parms}\n'.format(path=path, parms=' '.join(dumped)))
+    return ''.join(lines), ''
+
+
+class playbar(object):
+    @staticmethod
+    def playbackRange():
+        return session.playback_range
+
+    @staticmethod
+    def setPlaybackRange(start, end):
+        session.playback_range = (float(start), float(end))
+
+
+class hipFile(object):
+    @staticmethod
+    def path():
+        return session.hip_path
+
+    @staticmethod
+    def name():
+        return session.hip_path
+
+    @staticmethod
+    def basename():
+        return os.path.basename(session.hip_path)
+
+    @staticmethod
+    def hasUnsavedChanges():
+        return session.unsaved
+
+    @staticmethod
+    def save(file_name=None):
+        if file_name is not None:
+            session.hip_path = file_name
+        session.unsaved = False
+
+    @staticmethod
+    def clear(suppress_save_prompt=False):
+        global session
+        session = Session()
+
+    @staticmethod
+    def load(file_name, suppress_save_prompt=False, ignore_load_warnings=False):
+        builder = HIP_SCENES.get(file_name)
+        if builder is None:
+            raise OperationFailed('Unable to open file: {path}'.format(path=file_name))
+        hipFile.clear()
+        builder()
+        session.hip_path = file_name
+        session.unsaved = False
+
+
+def install():
+    """
+    Register this module as hou, for callers that import hou or preflight.core afterwards
+    """
+    module = sys.modules[__name__]
+    sys.modules['hou'] = module
+    core = sys.modules.get('preflight.core')
+    if core is not None:
+        core.hou = module
+    return module
+
+
+def installUnlessHoudini():
+    """
+    The hou of a running Houdini session, or this module installed as hou when there is none. The hou.py stub
+    at the repository root answers every call with None and counts as none
+    """
+    try:
+        import hou
+    except ImportError:
+        hou = None
+    if hou is None or hou.node('/out') is None:
+        hou = install()
+    return hou
+
+
+def buildScene(rops=1, aovs=8, cams=1, domes=1, lights=0, hip_path=None):
+    """
+    Replace the session with a generated scene of rops Redshift ROPs with aovs AOVs each, cams cameras,
+    domes dome lights and lights area lights. ROPs render through the cameras in turn and the AOVs cycle
+    through SCENE_AOVS, so the first two are the crypto mattes and the third the motion vectors
+    """
+    hipFile.clear()
+    obj = node('/obj')
+    out = node('/out')
+
+    for i in range(cams):
+        cam = obj.createNode('cam', 'cam{n}'.format(n=i + 1))
+        cam.parmTuple('res').set(SCENE_RESOLUTIONS[i % len(SCENE_RESOLUTIONS)])
+
+    for i in range(domes):
+        obj.createNode('rslightdome::2.0', 'rsdome{n}'.format(n=i + 1))
+
+    for i in range(lights):
+        obj.createNode('rslight', 'rslight{n}'.format(n=i + 1))
+
+    for i in range(rops):
+        rop = out.createNode('Redshift_ROP', 'Redshift_ROP{n}'.format(n=i + 1))
+        if cams:
+            rop.parm('RS_renderCamera').set('/obj/cam{n}'.format(n=i % cams + 1))
+        rop.parm('RS_aov').set(aovs)
+        for index in range(aovs):
+            aov_id, suffix = SCENE_AOVS[index % len(SCENE_AOVS)]
+            if index >= len(SCENE_AOVS):
+                suffix = '{suffix}{n}'.format(suffix=suffix, n=index // len(SCENE_AOVS) + 1)
+            rop.parm('RS_aovID_{n}'.format(n=index + 1)).set(aov_id)
+            rop.parm('RS_aovSuffix_{n}'.format(n=index + 1)).set(suffix)
+
+    if hip_path is not None:
+        session.hip_path = hip_path
+    session.unsaved = False
+    return session
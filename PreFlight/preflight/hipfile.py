@@ -0,0 +1,432 @@
+"""
+Offline .hip reader
+Reads the node and parameter sections of .hip/.hipnc/.hiplc files without Houdini, so the preflight checks
+can run with no license and no hou import.
+
+A hip file is a cpio archive (portable ASCII format) of text sections, one set per node:
+    obj/cam1.init   type = cam
+    obj/cam1.parm   {  resx [ 0 locks=0 ] ( 1920 ) ... }
+plus scene sections such as .start holding the hscript playbar setup.
+
+The file is memory-mapped and indexed in one scan of the cpio headers, recording the byte offset and size of
+every section and the type of every node. Parm sections are then sliced straight out of the map and only
+parsed when a check asks for one of their values. The index is cached next to the hip file as
+<name>.hip.pfidx, keyed on the file size and mtime, so repeat preflights of the same file skip the scan.
+
+Usage
+    from preflight import core, hipfile
+    with hipfile.HipFile('/shots/sh0100.hip') as hip:
+        results = core.runChecks(hip)
+"""
+
+import ast
+import fnmatch
+import json
+import math
+import mmap
+import os
+import re
+
+CPIO_MAGIC = b'070707'
+CPIO_HEADER_SIZE = 76
+CPIO_TRAILER = 'TRAILER!!!'
+
+INDEX_EXTENSION = '.pfidx'
+INDEX_VERSION = 1
+
+# Node type category of the nodes under each network a hip file saves. The file only stores type names, so
+# nodes nested deeper take theirs from the type of the network holding them, see HipNode.category()
+NETWORK_CATEGORIES = {'obj': 'Object', 'out': 'Driver'}
+
+# Category of the children of the network types that hold another category, e.g. the ROPs of a ropnet inside
+# /obj. Subnets, assets and any other type not listed hold nodes of their own category
+CHILD_CATEGORIES = {
+    'ropnet': 'Driver',
+    'geo': 'Sop',
+    'matnet': 'Vop',
+    'shopnet': 'Shop',
+    'chopnet': 'Chop',
+    'cop2net': 'Cop2',
+    'dopnet': 'Dop',
+    'lopnet': 'Lop',
+}
+
+# Component suffixes of parm tuples, a tuple saved as "res ( 1920 1080 )" is read back as resx and resy
+TUPLE_COMPONENTS = ('xyzw', '1234', 'rgba', 'uvw')
+
+# Values of the parms the checks read when a file does not store them
+PARM_DEFAULTS = {
+    'RS_aov': 0,
+    'RS_aovDeepEnabled': 0,
+    'RS_GIEnabled': 1,
+    'MotionBlurEnabled': 0,
+    'RS_globalEnvironment': '',
+    'RS_renderCamera': '/obj/cam1',
+    'f1': 1,
+    'f2': 240,
+    'f3': 1,
+    'resx': 1920,
+    'resy': 1080,
+    'aspect': 1,
+    'near': 0.001,
+    'far': 10000,
+    'RS_campro_dofEnable': 0,
+    'background_enable': 1,
+    'backPlateEnabled': 0,
+}
+
+# Values of the parm tuples the checks read when a file does not store them
+PARM_TUPLE_DEFAULTS = {
+    'res': (1920, 1080),
+}
+
+TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]()]|[^\s\[\]()"]+')
+RANGE_RE = re.compile(r'^\s*frange\s+(\S+)\s+(\S+)', re.MULTILINE)
+TSET_RE = re.compile(r'^\s*tset\s+`([^`]*)`\s+`([^`]*)`', re.MULTILINE)
+FPS_RE = re.compile(r'^\s*fps\s+(\S+)', re.MULTILINE)
+
+# Operators a saved range expression may use, anything else in it is refused rather than evaluated
+EXPRESSION_OPERATORS = {
+    ast.Add: lambda a, b: a + b,
+    ast.Sub: lambda a, b: a - b,
+    ast.Mult: lambda a, b: a * b,
+    ast.Div: lambda a, b: a / b,
+}
+
+
+class HipError(Exception):
+    pass
+
+
+def scanSections(data):
+    """
+    Walk the cpio headers of a mapped hip file, yielding (name, offset, size) of every section's data
+    without reading it
+    """
+    pos = 0
+    while True:
+        header = data[pos:pos + CPIO_HEADER_SIZE]
+        if len(header) < CPIO_HEADER_SIZE or header[:6] != CPIO_MAGIC:
+            raise HipError('not a hip archive or truncated at byte {pos}'.format(pos=pos))
+        name_size = int(header[59:65], 8)
+        data_size = int(header[65:76], 8)
+        pos += CPIO_HEADER_SIZE
+        name = data[pos:pos + name_size - 1].decode('utf-8', 'replace')
+        pos += name_size
+        if name == CPIO_TRAILER:
+            return
+        yield name, pos, data_size
+        pos += data_size
+
+
+def nodeType(init):
+    for line in init.decode('utf-8', 'replace').splitlines():
+        key, sep, value = line.partition('=')
+        if sep and key.strip() == 'type':
+            return value.strip()
+    return None
+
+
+def buildIndex(data):
+    """
+    Index of a mapped hip file, {'sections': {name: [offset, size]}, 'types': {node path: type name}}
+    """
+    sections = {}
+    types = {}
+    for name, offset, size in scanSections(data):
+        sections[name] = [offset, size]
+        if name.endswith('.init'):
+            types['/' + name[:-5]] = nodeType(data[offset:offset + size])
+    return {'sections': sections, 'types': types}
+
+
+def indexPath(path):
+    return path + INDEX_EXTENSION
+
+
+def loadIndex(path, stat):
+    try:
+        with open(indexPath(path)) as f:
+            index = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    if index.get('version') != INDEX_VERSION or index.get('size') != stat.st_size or \
+            index.get('mtime') != stat.st_mtime:
+        return None
+    return index
+
+
+def saveIndex(path, stat, index):
+    index = dict(index, version=INDEX_VERSION, size=stat.st_size, mtime=stat.st_mtime)
+    try:
+        with open(indexPath(path), 'w') as f:
+            json.dump(index, f)
+    except (IOError, OSError):
+        # Read-only shot directories just rescan next time
+        pass
+
+
+def parseValue(token):
+    # Quoted values are strings, a string parm holding on or 1001 keeps it
+    if token.startswith('"'):
+        return token[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+    if token in ('on', 'off'):
+        return 1 if token == 'on' else 0
+    try:
+        return int(token)
+    except ValueError:
+        pass
+    try:
+        return float(token)
+    except ValueError:
+        return token
+
+
+def parseParms(text):
+    """
+    Parse a .parm section into {parm tuple name: [values]}. Animated values, saved as [ channel value ],
+    keep the value they were saved with
+    """
+    parms = {}
+    for line in text.splitlines():
+        tokens = TOKEN_RE.findall(line)
+        if len(tokens) < 4 or tokens[1] != '[':
+            continue
+        values = []
+        channel = None
+        in_values = False
+        for token in tokens[2:]:
+            if not in_values:
+                in_values = token == '('
+            elif token == ')':
+                break
+            elif token == '[':
+                channel = []
+            elif token == ']':
+                if channel:
+                    values.append(parseValue(channel[-1]))
+                channel = None
+            elif channel is not None:
+                channel.append(token)
+            else:
+                values.append(parseValue(token))
+        parms[tokens[0]] = values
+    return parms
+
+
+def evalNode(node, expression):
+    if isinstance(node, ast.Expression):
+        return evalNode(node.body, expression)
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return float(node.value)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.UAdd, ast.USub)):
+        value = evalNode(node.operand, expression)
+        return -value if isinstance(node.op, ast.USub) else value
+    if isinstance(node, ast.BinOp) and type(node.op) in EXPRESSION_OPERATORS:
+        return EXPRESSION_OPERATORS[type(node.op)](evalNode(node.left, expression), evalNode(node.right, expression))
+    raise HipError('cannot evaluate {e}'.format(e=expression))
+
+
+def evalExpression(expression, fps):
+    """
+    Value of a saved arithmetic expression like (1-1)/$FPS, literals and + - * / only. The text comes from the
+    hip file, so it is walked as a syntax tree and never run
+    """
+    expression = expression.replace('$FPS', repr(float(fps)))
+    try:
+        value = evalNode(ast.parse(expression.strip(), mode='eval'), expression)
+    except (SyntaxError, ValueError, ArithmeticError, RecursionError, MemoryError) as e:
+        raise HipError('cannot evaluate {e}: {error}'.format(e=expression, error=e))
+    if not math.isfinite(value):
+        raise HipError('{e} is not a finite number'.format(e=expression))
+    return value
+
+
+class HipParm(object):
+    __slots__ = ('node', '_name', 'value')
+
+    def __init__(self, node, name, value):
+        self.node = node
+        self._name = name
+        self.value = value
+
+    def name(self):
+        return self._name
+
+    def eval(self):
+        return self.value
+
+
+class HipParmTuple(object):
+    __slots__ = ('node', '_name', 'values')
+
+    def __init__(self, node, name, values):
+        self.node = node
+        self._name = name
+        self.values = tuple(values)
+
+    def name(self):
+        return self._name
+
+    def eval(self):
+        return self.values
+
+
+class HipNodeType(object):
+    __slots__ = ('category', '_name')
+
+    def __init__(self, category, name):
+        self.category = category
+        self._name = name
+
+    def name(self):
+        return self._name
+
+    def nameWithCategory(self):
+        return '{category}/{name}'.format(category=self.category, name=self._name)
+
+
+class HipNode(object):
+    """
+    A node read from a hip file, answering the parts of hou.Node the checks use
+    """
+
+    def __init__(self, hip, path, type_name):
+        self.hip = hip
+        self._path = path
+        self.type_name = type_name
+        self.parms = None
+        self._category = None
+
+    def name(self):
+        return self._path.rsplit('/', 1)[-1]
+
+    def path(self):
+        return self._path
+
+    def category(self):
+        """
+        Node type category, the child category of the network holding this node
+        """
+        if self._category is None:
+            parent = self.hip.nodes.get(self._path.rsplit('/', 1)[0])
+            if parent is None:
+                network = self._path.split('/')[1]
+                self._category = NETWORK_CATEGORIES.get(network, network.capitalize())
+            else:
+                self._category = CHILD_CATEGORIES.get(parent.type_name) or parent.category()
+        return self._category
+
+    def type(self):
+        return HipNodeType(self.category(), self.type_name)
+
+    def __str__(self):
+        return self.name()
+
+    def parmValues(self):
+        if self.parms is None:
+            text = self.hip.section(self._path[1:] + '.parm') or b''
+            self.parms = parseParms(text.decode('utf-8', 'replace'))
+        return self.parms
+
+    def parm(self, name):
+        parms = self.parmValues()
+        if name in parms:
+            return HipParm(self, name, parms[name][0] if parms[name] else None)
+
+        # Component of a parm tuple
+        tuple_name, component = name[:-1], name[-1]
+        if tuple_name in parms:
+            for components in TUPLE_COMPONENTS:
+                index = components.find(component)
+                if 0 <= index < len(parms[tuple_name]):
+                    return HipParm(self, name, parms[tuple_name][index])
+
+        if name in PARM_DEFAULTS:
+            return HipParm(self, name, PARM_DEFAULTS[name])
+        return None
+
+    def globParms(self, pattern):
+        patterns = pattern.split()
+        return [HipParm(self, name, values[0] if values else None) for name, values in self.parmValues().items()
+                if any(fnmatch.fnmatchcase(name, p) for p in patterns)]
+
+    def parmTuple(self, name):
+        parms = self.parmValues()
+        if name in parms:
+            return HipParmTuple(self, name, parms[name])
+        if name in PARM_TUPLE_DEFAULTS:
+            return HipParmTuple(self, name, PARM_TUPLE_DEFAULTS[name])
+        return None
+
+
+class HipFile(object):
+    """
+    Scene read from a hip file, used by preflight.core in place of the hou session
+    """
+
+    def __init__(self, path, use_cache=True):
+        self.path = path
+        self.file = open(path, 'rb')
+        try:
+            stat = os.fstat(self.file.fileno())
+            if stat.st_size == 0:
+                raise HipError('{path} is empty'.format(path=path))
+            self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.file.close()
+            raise
+
+        index = loadIndex(path, stat) if use_cache else None
+        if index is None:
+            index = buildIndex(self.data)
+            if use_cache:
+                saveIndex(path, stat, index)
+        self.sections = index['sections']
+        self.nodes = {}
+        for node_path, type_name in index['types'].items():
+            self.nodes[node_path] = HipNode(self, node_path, type_name)
+        self.start_script = (self.section('.start') or b'').decode('utf-8', 'replace')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def section(self, name):
+        if name not in self.sections:
+            return None
+        offset, size = self.sections[name]
+        return self.data[offset:offset + size]
+
+    def node(self, path):
+        return self.nodes.get(path)
+
+    def allNodes(self):
+        return self.nodes.values()
+
+    def playbackRange(self):
+        match = RANGE_RE.search(self.start_script)
+        if match:
+            return float(match.group(1)), float(match.group(2))
+
+        # Global range, saved as times in seconds
+        fps = FPS_RE.search(self.start_script)
+        fps = float(fps.group(1)) if fps else 24.0
+        match = TSET_RE.search(self.start_script)
+        if match:
+            start = evalExpression(match.group(1), fps)
+            end = evalExpression(match.group(2), fps)
+            return float(round(start * fps) + 1), float(round(end * fps))
+        return 1.0, 240.0
+
+    def hipName(self):
+        return os.path.basename(self.path)
+
+    def hasUnsavedChanges(self):
+        return False
@@ -0,0 +1,121 @@
+"""
+Preflight logging
+One 'preflight' logger for the package. Messages are logged with %-style arguments so they are only formatted
+when a handler writes them, and loops guard their debug output with a single isEnabledFor() test, so
+disabled levels cost nothing per node. Warnings and errors go to stderr by default.
+
+Environment
+    PREFLIGHT_LOG         console level, e.g. DEBUG to see the per node output in the Houdini console
+    PREFLIGHT_LOG_BUFFER  keep the last N records of every level in memory and write them out on an error
+
+Usage
+    from preflight.logger import log
+    log.debug("[CameraInfo]%s added to Cameras List", cam)
+"""
+
+import collections
+import logging
+import os
+import sys
+
+from logging import DEBUG, ERROR, INFO, WARNING  # noqa: F401
+
+LOG_ENV = 'PREFLIGHT_LOG'
+LOG_BUFFER_ENV = 'PREFLIGHT_LOG_BUFFER'
+LOG_FORMAT = '%(asctime)s %(levelname)s %(message)s'
+
+log = logging.getLogger('preflight')
+# stdout carries the results of the batch workers, keep log output off it
+log.propagate = False
+
+console = logging.StreamHandler(sys.stderr)
+console.setFormatter(logging.Formatter(LOG_FORMAT))
+ring = None
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Keeps the last capacity records unformatted and writes them all out when one at flush_level or above
+    arrives, so an error comes with the debug output leading up to it
+    """
+
+    def __init__(self, capacity=1000, flush_level=ERROR, stream=None):
+        logging.Handler.__init__(self)
+        self.records = collections.deque(maxlen=capacity)
+        self.flush_level = flush_level
+        self.stream = stream
+        self.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    def emit(self, record):
+        self.records.append(record)
+        if record.levelno >= self.flush_level:
+            self.dump()
+
+    def lines(self):
+        return [self.format(record) for record in self.records]
+
+    def dump(self, stream=None):
+        stream = stream or self.stream or sys.stderr
+        for line in self.lines():
+            stream.write(line + '\n')
+        stream.flush()
+        self.records.clear()
+
+
+def updateLevel():
+    # The logger level is the cheap test every call makes, keep it at the lowest level a handler wants
+    log.setLevel(min(handler.level for handler in log.handlers))
+
+
+def setLevel(level):
+    """
+    Console level, a logging level or its name
+    """
+    console.setLevel(level)
+    updateLevel()
+
+
+def enableRingBuffer(capacity=1000, flush_level=ERROR):
+    global ring
+    disableRingBuffer()
+    ring = RingBufferHandler(capacity, flush_level)
+    ring.setLevel(DEBUG)
+    log.addHandler(ring)
+    updateLevel()
+    return ring
+
+
+def disableRingBuffer():
+    global ring
+    if ring is not None:
+        log.removeHandler(ring)
+        ring = None
+        updateLevel()
+
+
+def ringLines():
+    """
+    Formatted records held by the ring buffer, empty when it is not enabled
+    """
+    if ring is None:
+        return []
+    return ring.lines()
+
+
+def configure():
+    """
+    Console level and ring buffer from the environment
+    """
+    global ring
+    ring = None
+    log.handlers = [console]
+    try:
+        setLevel(os.environ.get(LOG_ENV, 'WARNING').upper())
+    except ValueError:
+        setLevel(WARNING)
+    capacity = int(os.environ.get(LOG_BUFFER_ENV, 0) or 0)
+    if capacity > 0:
+        enableRingBuffer(capacity)
+
+
+configure()
@@ -0,0 +1,173 @@
+"""
+hscript opparm dumps
+Builds the opparm -d command reading the planned parms of one node in a single hou.hscript() round trip and
+parses its output back into parm values, for the hscript read backend of preflight.core. No hou is imported
+here, the caller runs the command.
+
+An opparm dump lists every parm tuple with its values in brackets, strings quoted when they need it:
+    opparm -V 20.0.547 /out/Redshift_ROP1 f ( 1 240 1 ) RS_renderCamera ( /obj/cam1 ) RS_aovSuffix_1 ( Z )
+Only literal values are taken from it, as the text opparm printed. Toggles print as on and off and menus as
+their token, typedValue() turns the text into the value HOM evaluates the parm to from the parm's template.
+Values holding an expression or a variable, and parms the output animates with chadd/chkey commands, come
+back as UNRESOLVED so the caller evaluates them through HOM.
+
+Usage
+    from preflight import opparm
+    out, err = hou.hscript(opparm.dumpCommand('/out/Redshift_ROP1', ['RS_aov', 'RS_aovSuffix_*']))
+    dump = opparm.parseDump(out)
+    opparm.typedValue(opparm.parmValue(dump, 'RS_aov'), ('Int', ()))
+"""
+
+import re
+
+from preflight.hipfile import TUPLE_COMPONENTS
+
+# Stands in for a value the dump does not hold as a literal
+UNRESOLVED = object()
+
+TOKEN_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`|[()]|[^\s()'\"`]+")
+
+# opparm options followed by a value
+OPTION_VALUES = ('-V',)
+
+# Components whose tuple is asked for as well. Rarer ones like rgba are left out, they would add a bogus name
+# for every parm ending in one of those letters, and a parm missing from the dump is read through HOM anyway
+DUMP_COMPONENTS = 'xyzw1234'
+
+# Toggle values as opparm prints them
+TOGGLE_VALUES = {'on': 1, 'off': 0, '1': 1, '0': 0}
+
+# Parm template types evaluating to an int. Multiparm counters are folder templates holding the instance count
+INT_TYPES = ('Int', 'Folder')
+
+
+def dumpNames(parms):
+    """
+    Names to ask opparm for, the planned parms plus the tuple of every parm that looks like a component,
+    since the dump lists f ( 1 240 1 ) rather than f1
+    """
+    names = set(parms)
+    for parm in parms:
+        if len(parm) > 1 and parm[-1] in DUMP_COMPONENTS:
+            names.add(parm[:-1])
+    return sorted(names)
+
+
+def dumpCommand(path, names):
+    return 'opparm -d {path} {names}'.format(path=path, names=' '.join(names))
+
+
+def literal(token):
+    if token.startswith('`') or '$' in token:
+        return UNRESOLVED
+    if token.startswith("'"):
+        return token[1:-1].replace("\\'", "'").replace('\\\\', '\\')
+    if token.startswith('"'):
+        return token[1:-1].replace('\\"', '"').replace('\\\\', '\\')
+    return token
+
+
+def parseOpparm(tokens, parms):
+    index = 1
+    while index < len(tokens) and tokens[index].startswith('-'):
+        index += 2 if tokens[index] in OPTION_VALUES else 1
+    # Node path, every dump is of a single node
+    index += 1
+    while index + 1 < len(tokens):
+        name = tokens[index]
+        if tokens[index + 1] != '(':
+            index += 1
+            continue
+        values = []
+        index += 2
+        while index < len(tokens) and tokens[index] != ')':
+            values.append(literal(tokens[index]))
+            index += 1
+        parms[name] = values
+        index += 1
+
+
+def animate(parms, channel):
+    if channel in parms:
+        parms[channel] = [UNRESOLVED] * len(parms[channel])
+        return
+    tuple_name, component = channel[:-1], channel[-1]
+    for components in TUPLE_COMPONENTS:
+        index = components.find(component)
+        if tuple_name in parms and 0 <= index < len(parms[tuple_name]):
+            parms[tuple_name][index] = UNRESOLVED
+            return
+
+
+def parseDump(text):
+    """
+    Parse opparm output into {parm tuple name: [value texts]}
+    """
+    parms = {}
+    channels = set()
+    for line in text.replace('\\\n', ' ').splitlines():
+        tokens = TOKEN_RE.findall(line)
+        if not tokens:
+            continue
+        if tokens[0] == 'opparm':
+            parseOpparm(tokens, parms)
+        elif tokens[0] in ('chadd', 'chkey'):
+            # Channel arguments are either node/channel paths or channel names after the node path
+            channels.update(t.rsplit('/', 1)[-1] for t in tokens[1:] if t[0].isalpha() or t.startswith('/'))
+
+    for channel in channels:
+        animate(parms, channel)
+    return parms
+
+
+def parmValue(dump, name):
+    """
+    Value text of parm name in a parsed dump, UNRESOLVED when the dump does not hold it as a literal
+    """
+    values = dump.get(name)
+    if values is not None:
+        return values[0] if len(values) == 1 else UNRESOLVED
+
+    tuple_name, component = name[:-1], name[-1]
+    values = dump.get(tuple_name)
+    if values is not None:
+        for components in TUPLE_COMPONENTS:
+            index = components.find(component)
+            if 0 <= index < len(values):
+                return values[index]
+    return UNRESOLVED
+
+
+def tupleValue(dump, name):
+    values = dump.get(name)
+    if values is None or any(value is UNRESOLVED for value in values):
+        return UNRESOLVED
+    return tuple(values)
+
+
+def typedValue(value, kind):
+    """
+    A dumped value as HOM evaluates a parm of kind, its (parm template type name, menu tokens). Strings stay
+    as they were printed, toggles and ints are numbers, menu tokens their index in the menu. UNRESOLVED when
+    the text does not fit the kind or the kind is not known
+    """
+    if value is UNRESOLVED or kind is None:
+        return UNRESOLVED
+    type_name, menu = kind
+    if type_name == 'String':
+        return value
+    if type_name == 'Toggle':
+        return TOGGLE_VALUES.get(value, UNRESOLVED)
+    if type_name == 'Menu' and value in menu:
+        return menu.index(value)
+    try:
+        if type_name == 'Float':
+            return float(value)
+        if type_name in INT_TYPES or type_name == 'Menu':
+            return int(value)
+    except ValueError:
+        pass
+    # Int parms with a menu print the token of the item like menus do
+    if type_name == 'Int' and value in menu:
+        return menu.index(value)
+    return UNRESOLVED
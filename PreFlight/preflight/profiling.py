@@ -0,0 +1,135 @@
+"""
+Preflight profile
+Wall time and HOM call counts of a preflight run, per section (scene collection, snapshot, each check) and
+per node within a section. preflight.core records into the profile set with core.setProfile(), and does
+nothing extra while no profile is set.
+
+Counters
+    parm     node.parm() lookups
+    eval     parm.eval() calls
+    node     hou.node() path resolutions
+    read     values the checks read back from the snapshot
+    hscript  hou.hscript() round trips of the hscript read backend
+
+Usage
+    from preflight import core, profiling
+    profile = profiling.Profile()
+    core.setProfile(profile)
+    core.runChecks()
+    profile.save('/tmp/preflight_profile.json')
+"""
+
+import json
+import time
+
+COUNTERS = ('parm', 'eval', 'node', 'read', 'hscript')
+
+
+class ProfileCounts(object):
+    __slots__ = ('time', 'parm', 'eval', 'node', 'read', 'hscript')
+
+    def __init__(self):
+        self.time = 0.0
+        self.parm = 0
+        self.eval = 0
+        self.node = 0
+        self.read = 0
+        self.hscript = 0
+
+    def toJson(self):
+        counts = {'time_ms': self.time * 1000.0}
+        for counter in COUNTERS:
+            counts[counter] = getattr(self, counter)
+        return counts
+
+
+class ProfileSection(object):
+    """
+    Times one block of a section, e.g. a single check run or a single node read into the snapshot. Setting
+    path inside the block also adds its time to that node
+    """
+    __slots__ = ('profile', 'name', 'path', 'previous', 'start')
+
+    def __init__(self, profile, name):
+        self.profile = profile
+        self.name = name
+        self.path = None
+
+    def __enter__(self):
+        self.previous = self.profile.current
+        self.profile.current = self.name
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        elapsed = time.perf_counter() - self.start
+        self.profile.totals(self.name).time += elapsed
+        if self.path is not None:
+            self.profile.nodeTotals(self.name, self.path).time += elapsed
+        self.profile.current = self.previous
+
+
+class NoProfileSection(object):
+    """
+    Stands in for ProfileSection while no profile is set
+    """
+    __slots__ = ('path',)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+NO_PROFILE_SECTION = NoProfileSection()
+
+
+class Profile(object):
+    def __init__(self):
+        self.sections = {}
+        self.nodes = {}
+        self.current = None
+
+    def totals(self, name):
+        counts = self.sections.get(name)
+        if counts is None:
+            counts = self.sections[name] = ProfileCounts()
+        return counts
+
+    def section(self, name):
+        """
+        Context manager adding the time of the block and the calls counted in it to section name. Blocks of
+        the same name add up, so a section can be entered once per node or per check run
+        """
+        return ProfileSection(self, name)
+
+    def nodeTotals(self, name, path):
+        counts = self.nodes.get((name, path))
+        if counts is None:
+            counts = self.nodes[(name, path)] = ProfileCounts()
+        return counts
+
+    def count(self, path, counter, n=1):
+        """
+        Add n calls of counter made on the node at path to the current section
+        """
+        name = self.current or 'other'
+        counts = self.nodeTotals(name, path)
+        setattr(counts, counter, getattr(counts, counter) + n)
+        totals = self.totals(name)
+        setattr(totals, counter, getattr(totals, counter) + n)
+
+    def nodeCounts(self, name):
+        return [(path, counts) for (section, path), counts in self.nodes.items() if section == name]
+
+    def toJson(self):
+        sections = {}
+        for name, counts in self.sections.items():
+            section = sections[name] = counts.toJson()
+            section['nodes'] = {path: node.toJson() for path, node in self.nodeCounts(name)}
+        return {'sections': sections}
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.toJson(), f, indent=4)
@@ -0,0 +1,482 @@
+"""
+Preflight window
+Qt front end for preflight.core, only imported when the Houdini UI is available.
+"""
+
+import os
+import time
+
+from PySide2 import QtCore, QtGui, QtWidgets
+
+from preflight.core import (SEVERITY_ERROR, SEVERITY_WARNING, LiveChecks, getChecks, iterChecks, saveStatus,
+                            setProfile)
+from preflight.profiling import COUNTERS, Profile
+
+# Live mode, node events are coalesced for LIVE_INTERVAL_MS and checks re-run for at most LIVE_BUDGET_MS per UI frame
+LIVE_INTERVAL_MS = 150
+LIVE_BUDGET_MS = 10
+
+# Placeholder shown under each check until its result arrives
+PENDING = 'Checking...'
+
+# Colour of the result lines of each severity, MUTED lines are the placeholders and status lines no check reported
+MUTED = 'muted'
+SEVERITY_COLORS = {SEVERITY_WARNING: 'orange', SEVERITY_ERROR: 'red', MUTED: 'gray'}
+
+# Setting this environment variable profiles the run and adds the Profile tab
+PROFILE_ENV = 'PREFLIGHT_PROFILE'
+PROFILE_COLUMNS = ('Section / Node', 'ms', 'parm()', 'eval()', 'hou.node()', 'Reads', 'hscript')
+
+# Keeps the window open once show() returns
+window = None
+
+
+def errorLines(error):
+    return [('{t}: {e}'.format(t=type(error).__name__, e=error), SEVERITY_ERROR)]
+
+
+def checkLines(check, result):
+    if isinstance(result, Exception):
+        return errorLines(result)
+    return check.display(result)
+
+
+def severityBrush(severity):
+    color = SEVERITY_COLORS.get(severity)
+    return QtGui.QBrush(QtGui.QColor(color)) if color else None
+
+
+def profileRow(name, counts):
+    return [name, '{t:.3f}'.format(t=counts.time * 1000.0)] + [str(getattr(counts, c)) for c in COUNTERS]
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("HoudiniPreflight")
+        MainWindow.resize(736, 531)
+        MainWindow.setWindowTitle("Houdini Preflight")
+
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setMinimumSize(QtCore.QSize(0, 0))
+        self.centralwidget.setMaximumSize(QtCore.QSize(16777215, 800))
+        self.centralwidget.setObjectName("centralwidget")
+
+        self.gridLayout = QtWidgets.QGridLayout(self.centralwidget)
+        self.gridLayout.setObjectName("gridLayout")
+
+        # Title
+        self.title = QtWidgets.QLabel(self.centralwidget)
+        self.title.setStyleSheet("font-weight: bold;font-size: 1.5 em;")
+        self.title.setObjectName("title")
+        self.title.setText("Houdini Preflight")
+
+        self.gridLayout.addWidget(self.title, 0, 0, 1, 1)
+
+        # Live Update Toggle
+        self.live = None
+        self.scheduler = None
+        self.live_toggle = QtWidgets.QCheckBox(self.centralwidget)
+        self.live_toggle.setObjectName("live_toggle")
+        self.live_toggle.setText("Live Update")
+        self.live_toggle.toggled.connect(self.setLive)
+        self.gridLayout.addWidget(self.live_toggle, 0, 1, 1, 1)
+        MainWindow.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        MainWindow.destroyed.connect(lambda: self.setLive(False))
+
+        # Cancel Running Checks
+        self.cancel = QtWidgets.QPushButton(self.centralwidget)
+        self.cancel.setObjectName("cancel")
+        self.cancel.setText("Cancel")
+        self.gridLayout.addWidget(self.cancel, 0, 2, 1, 1)
+
+        # Results Filter
+        self.filter = QtWidgets.QLineEdit(self.centralwidget)
+        self.filter.setObjectName("filter")
+        self.filter.setPlaceholderText("Filter")
+        self.gridLayout.addWidget(self.filter, 5, 0, 1, 4)
+
+        # Results Tree
+        self.results = ResultsModel(getChecks())
+        self.proxy = ResultsFilter()
+        self.proxy.setSourceModel(self.results)
+        self.proxy.setRecursiveFilteringEnabled(True)
+        self.proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.filter.textChanged.connect(self.proxy.setFilterFixedString)
+
+        self.tree = QtWidgets.QTreeView(self.centralwidget)
+        self.tree.setObjectName("tree")
+        self.tree.setMinimumSize(QtCore.QSize(700, 400))
+        self.tree.setUniformRowHeights(True)
+        self.tree.setHeaderHidden(True)
+        self.tree.setModel(self.proxy)
+
+        self.tree.expandAll()
+
+        # Results Tabs, the Profile tab is hidden unless PREFLIGHT_PROFILE is set
+        self.tabs = QtWidgets.QTabWidget(self.centralwidget)
+        self.tabs.setObjectName("tabs")
+        self.tabs.addTab(self.tree, "Results")
+        self.gridLayout.addWidget(self.tabs, 6, 0, 1, 4)
+
+        self.profile = None
+        if os.environ.get(PROFILE_ENV):
+            self.setupProfile()
+        MainWindow.destroyed.connect(lambda: self.stopProfile())
+
+        # Checks fill in their sections as they finish, live mode needs the full snapshot first
+        self.live_toggle.setEnabled(False)
+        self.run = ProgressiveRun(iterChecks(), self.applyResults, self.runFinished)
+        self.cancel.clicked.connect(self.run.cancel)
+        MainWindow.destroyed.connect(lambda: self.run.stop())
+        self.run.start()
+
+        # HIP info
+        hip_name, status = saveStatus()
+        # HIP TITLE
+        self.file_name = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding,
+                                           QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.file_name.sizePolicy().hasHeightForWidth())
+        self.file_name.setSizePolicy(sizePolicy)
+        self.file_name.setStyleSheet("font-weight: bold;")
+        self.file_name.setObjectName("file_name")
+        self.file_name.setText("File Name:")
+        self.gridLayout.addWidget(self.file_name, 3, 0, 1, 1)
+
+        # HIP Status Title
+        self.file_status = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding,
+                                           QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.file_status.sizePolicy().hasHeightForWidth())
+        self.file_status.setSizePolicy(sizePolicy)
+        self.file_status.setStyleSheet("font-weight: bold;")
+        self.file_status.setObjectName("file_status")
+        self.file_status.setText("File Status:")
+        self.gridLayout.addWidget(self.file_status, 3, 1, 1, 1)
+
+        # HIP Save Status
+        self.file_save = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding,
+                                           QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.file_save.sizePolicy().hasHeightForWidth())
+        self.file_save.setSizePolicy(sizePolicy)
+        brush = severityBrush(status.severity)
+        if brush is not None:
+            palette = self.file_save.palette()
+            palette.setBrush(QtGui.QPalette.WindowText, brush)
+            self.file_save.setPalette(palette)
+        self.file_save.setObjectName("file_save")
+        self.file_save.setText(status.text())
+        self.gridLayout.addWidget(self.file_save, 4, 1, 1, 1)
+
+        # HIP File Path
+        self.file_path = QtWidgets.QLabel(self.centralwidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding,
+                                           QtWidgets.QSizePolicy.Policy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.file_path.sizePolicy().hasHeightForWidth())
+        self.file_path.setSizePolicy(sizePolicy)
+        self.file_path.setObjectName("file_path")
+        self.file_path.setText(hip_name)
+
+        self.gridLayout.addWidget(self.file_path, 4, 0, 1, 1)
+
+        MainWindow.setCentralWidget(self.centralwidget)
+
+    def setupProfile(self):
+        self.profile = Profile()
+        setProfile(self.profile)
+
+        self.profile_tab = QtWidgets.QWidget()
+        self.profile_tab.setObjectName("profile_tab")
+        layout = QtWidgets.QVBoxLayout(self.profile_tab)
+
+        self.profile_tree = QtWidgets.QTreeWidget(self.profile_tab)
+        self.profile_tree.setObjectName("profile_tree")
+        self.profile_tree.setUniformRowHeights(True)
+        self.profile_tree.setHeaderLabels(PROFILE_COLUMNS)
+        layout.addWidget(self.profile_tree)
+
+        self.profile_export = QtWidgets.QPushButton(self.profile_tab)
+        self.profile_export.setObjectName("profile_export")
+        self.profile_export.setText("Export JSON...")
+        self.profile_export.setEnabled(False)
+        self.profile_export.clicked.connect(self.exportProfile)
+        layout.addWidget(self.profile_export)
+
+        self.tabs.addTab(self.profile_tab, "Profile")
+
+    def stopProfile(self):
+        if self.profile is not None:
+            setProfile(None)
+
+    def showProfile(self):
+        self.profile_tree.clear()
+        sections = sorted(self.profile.sections.items(), key=lambda item: item[1].time, reverse=True)
+        for name, counts in sections:
+            item = QtWidgets.QTreeWidgetItem(self.profile_tree, profileRow(name, counts))
+            nodes = sorted(self.profile.nodeCounts(name), key=lambda node: (node[1].time, node[1].read),
+                           reverse=True)
+            for path, node_counts in nodes:
+                QtWidgets.QTreeWidgetItem(item, profileRow(path, node_counts))
+        for column in range(len(PROFILE_COLUMNS)):
+            self.profile_tree.resizeColumnToContents(column)
+        self.profile_export.setEnabled(True)
+
+    def exportProfile(self):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self.centralwidget, "Export Profile",
+                                                        "preflight_profile.json", "JSON (*.json)")
+        if path:
+            self.profile.save(path)
+
+    def setLive(self, enabled):
+        if self.live is not None:
+            self.scheduler.stop()
+            self.live.stop()
+            self.live = None
+            self.scheduler = None
+        if enabled:
+            self.live = LiveChecks()
+            self.scheduler = RefreshScheduler(self.live, self.applyResults)
+            self.live.on_dirty = self.scheduler.schedule
+            self.live.start()
+
+    def applyResults(self, results):
+        for check, result in results:
+            if check.section is not None:
+                self.results.setCheckLines(check, checkLines(check, result))
+        self.proxy.invalidateFilter()
+
+    def runFinished(self, error=None, cancelled=False):
+        if cancelled:
+            lines = [('Cancelled', MUTED)]
+        elif error is not None:
+            lines = errorLines(error)
+        else:
+            lines = None
+
+        if lines is not None:
+            for check in getChecks():
+                if self.results.isPending(check):
+                    self.results.setCheckLines(check, lines)
+            self.proxy.invalidateFilter()
+
+        self.cancel.setEnabled(False)
+        self.live_toggle.setEnabled(error is None and not cancelled)
+
+        # Live updates are not profiled
+        if self.profile is not None:
+            self.stopProfile()
+            self.showProfile()
+
+
+class ProgressiveRun(object):
+    """
+    Drives a cooperative check generator from a QTimer, running it for at most budget_ms per tick before
+    yielding back to the Qt event loop, and passing each tick's results to apply
+    """
+
+    def __init__(self, steps, apply, finished, budget_ms=LIVE_BUDGET_MS):
+        self.steps = steps
+        self.apply = apply
+        self.finished = finished
+        self.budget_ms = budget_ms
+        self.timer = QtCore.QTimer()
+        self.timer.timeout.connect(self.tick)
+
+    def start(self):
+        self.timer.start(0)
+
+    def stop(self):
+        running = self.timer.isActive()
+        self.timer.stop()
+        self.steps.close()
+        return running
+
+    def cancel(self):
+        if self.stop():
+            self.finished(cancelled=True)
+
+    def tick(self):
+        start = time.perf_counter()
+        results = []
+        error = None
+        done = False
+        try:
+            while time.perf_counter() - start < self.budget_ms / 1000.0:
+                step = next(self.steps)
+                if step is not None:
+                    results.append(step)
+        except StopIteration:
+            done = True
+        except Exception as e:
+            error = e
+            done = True
+
+        if results:
+            self.apply(results)
+        if done:
+            self.timer.stop()
+            self.finished(error=error)
+
+
+class RefreshScheduler(object):
+    """
+    Sits between LiveChecks and the window. The first node event starts a timer, events arriving before it
+    fires are coalesced into one flush, and each tick re-runs dirty checks for at most budget_ms before
+    yielding back to the event loop and continuing on the next tick
+    """
+
+    def __init__(self, live, apply, interval_ms=LIVE_INTERVAL_MS, budget_ms=LIVE_BUDGET_MS):
+        self.live = live
+        self.apply = apply
+        self.interval_ms = interval_ms
+        self.budget_ms = budget_ms
+        self.timer = QtCore.QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.tick)
+
+    def schedule(self):
+        if not self.timer.isActive():
+            self.timer.start(self.interval_ms)
+
+    def stop(self):
+        self.timer.stop()
+
+    def tick(self):
+        self.live.flush()
+        results = self.live.recompute(self.budget_ms / 1000.0)
+        if results:
+            self.apply(results)
+        if self.live.dirty:
+            self.timer.start(0)
+
+
+class ResultItem(object):
+    """
+    A section, check or result line row of the results tree, result lines keep the severity they are shown in
+    """
+    __slots__ = ('parent', 'children', 'text', 'severity', 'bold', 'line')
+
+    def __init__(self, parent, text, severity=None, bold=False, line=False):
+        self.parent = parent
+        self.children = []
+        self.text = text
+        self.severity = severity
+        self.bold = bold
+        self.line = line
+
+    def row(self):
+        if self.parent is None:
+            return 0
+        return self.parent.children.index(self)
+
+    def hasLines(self):
+        return self.line or any(child.hasLines() for child in self.children)
+
+
+class ResultsModel(QtCore.QAbstractItemModel):
+    """
+    Check results as a tree of section, check and result line rows. Only the visible rows are ever
+    turned into widgets by the view, so the window stays responsive however many lines there are
+    """
+
+    def __init__(self, checks, parent=None):
+        super().__init__(parent)
+        self.root = ResultItem(None, '')
+        self.items = {}
+        sections = {}
+        for check in checks:
+            if check.section is None:
+                continue
+            if check.section not in sections:
+                sections[check.section] = ResultItem(self.root, check.section, bold=True)
+                self.root.children.append(sections[check.section])
+            item = ResultItem(sections[check.section], check.title, bold=True)
+            item.children.append(ResultItem(item, PENDING, MUTED, line=True))
+            sections[check.section].children.append(item)
+            self.items[check.name] = item
+
+    def isPending(self, check):
+        item = self.items.get(check.name)
+        return item is not None and [child.text for child in item.children] == [PENDING]
+
+    def setCheckLines(self, check, lines):
+        item = self.items[check.name]
+        parent = self.createIndex(item.row(), 0, item)
+        if item.children:
+            self.beginRemoveRows(parent, 0, len(item.children) - 1)
+            item.children = []
+            self.endRemoveRows()
+        if lines:
+            self.beginInsertRows(parent, 0, len(lines) - 1)
+            item.children = [ResultItem(item, text, severity, line=True) for text, severity in lines]
+            self.endInsertRows()
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        item = parent.internalPointer() if parent.isValid() else self.root
+        if column == 0 and 0 <= row < len(item.children):
+            return self.createIndex(row, column, item.children[row])
+        return QtCore.QModelIndex()
+
+    def parent(self, index):
+        if not index.isValid():
+            return QtCore.QModelIndex()
+        item = index.internalPointer().parent
+        if item is None or item is self.root:
+            return QtCore.QModelIndex()
+        return self.createIndex(item.row(), 0, item)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        if parent.column() > 0:
+            return 0
+        item = parent.internalPointer() if parent.isValid() else self.root
+        return len(item.children)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 1
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = index.internalPointer()
+        if role == QtCore.Qt.DisplayRole:
+            return item.text
+        if role == QtCore.Qt.ForegroundRole:
+            return severityBrush(item.severity)
+        if role == QtCore.Qt.FontRole and item.bold:
+            font = QtGui.QFont()
+            font.setBold(True)
+            return font
+        return None
+
+
+class ResultsFilter(QtCore.QSortFilterProxyModel):
+    """
+    Text filter over the results that also hides checks and sections with nothing to report
+    """
+
+    def filterAcceptsRow(self, row, parent):
+        item = self.sourceModel().index(row, 0, parent).internalPointer()
+        if not item.hasLines():
+            return False
+        return super().filterAcceptsRow(row, parent)
+
+
+def show():
+    """
+    Open the preflight window for the current scene
+    """
+    global window
+    window = QtWidgets.QMainWindow()
+    ui = Ui_MainWindow()
+    ui.setupUi(window)
+    window.show()
+    return ui
@@ -0,0 +1,446 @@
+"""
+Houdini Pre Render Check - Batch Mode
+Runs the preflight checks headless over many .hip files on a pool of warm hython workers and writes one
+JSON result per scene. Workers keep their hou session between scenes and restart after --max-scenes.
+Every result carries the findings of each check with their severity, and the worst severity of the scene.
+Worker output other than results goes to one log per worker in the logs directory of the output.
+
+Every hython worker holds a Houdini license for as long as it runs, so -j defaults to HYTHON_JOBS workers
+rather than one per CPU. Raise it only as far as the licenses the farm can spare. Offline runs need no
+license and default to one process per CPU.
+
+Usage
+    python preflight_batch.py /shots/seq010 /shots/seq020/sh0100.hip -o /tmp/preflight -j 16
+
+    # Submission gate, send hip paths one per line and read back one JSON result per line
+    python preflight_batch.py --listen 7070 -j 4
+
+    # No Houdini, read the hip files with hipfile
+    python preflight_batch.py /shots/seq010 --offline
+
+    # Add per check timings and HOM call counts to every result
+    python preflight_batch.py /shots/seq010 --profile
+
+    # Read every node with one hscript opparm dump instead of a HOM call per parm
+    python preflight_batch.py /shots/seq010 --read hscript
+
+    # Find where animated render settings change from their keyframes instead of evaluating every frame
+    python preflight_batch.py /shots/seq010 --sample changes
+
+    # Failed results carry the last 2000 log records leading up to the error
+    PREFLIGHT_LOG_BUFFER=2000 python preflight_batch.py /shots/seq010
+"""
+
+import argparse
+import io
+import json
+import os
+import signal
+import socketserver
+import subprocess
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+HIP_EXTENSIONS = ('.hip', '.hipnc', '.hiplc')
+
+# Starts every result line a warm worker writes, whatever else reaches its stdout before serve() takes it over,
+# like a plugin banner at hython startup, is logged and skipped
+RESULT_PREFIX = '@preflight '
+
+# hython workers started when -j is not given, each one takes a Houdini license
+HYTHON_JOBS = 2
+
+
+def findHipFiles(paths):
+    hip_files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if name.endswith(HIP_EXTENSIONS):
+                        hip_files.append(os.path.join(root, name))
+        else:
+            hip_files.append(path)
+    return hip_files
+
+
+def getHython():
+    hfs = os.environ.get('HFS')
+    if hfs:
+        return os.path.join(hfs, 'bin', 'hython')
+    return 'hython'
+
+
+def resultRoot(hip_files):
+    """
+    Deepest directory holding every hip file, the result tree mirrors the hip files below it
+    """
+    dirs = [os.path.dirname(os.path.abspath(hip)) for hip in hip_files]
+    try:
+        return os.path.commonpath(dirs)
+    except ValueError:
+        # Hip files on different drives
+        return ''
+
+
+def resultPath(output_dir, root, hip):
+    """
+    JSON result path of hip, its path below root with the extension kept, so sh0100/lighting.hip and
+    sh0200/lighting.hip, or foo.hip and foo.hipnc, never share a result
+    """
+    hip = os.path.abspath(hip)
+    relative = os.path.relpath(hip, root) if root else os.path.splitdrive(hip)[1].lstrip(os.sep)
+    return os.path.join(output_dir, '{name}.json'.format(name=relative))
+
+
+def checkScene(hip, offline=False, profile=False):
+    """
+    Run every registered check on a hip file, loaded into the running hou session or read offline
+    """
+    from preflight import core, profiling
+    run_profile = profiling.Profile() if profile else None
+    core.setProfile(run_profile)
+    try:
+        if offline:
+            from preflight import hipfile
+            with hipfile.HipFile(hip) as scene:
+                results = core.runChecks(scene)
+        else:
+            import hou
+            hou.hipFile.load(hip, suppress_save_prompt=True, ignore_load_warnings=True)
+            # A new scene per hip file, a warm worker must not keep the caches of the last one
+            results = core.runChecks(core.HomScene())
+    finally:
+        core.setProfile(None)
+
+    # Gates read the worst severity instead of scanning the messages
+    worst = core.worstSeverity(results)
+    result = {'hip': hip, 'results': core.resultsJson(results),
+              'severity': core.SEVERITY_NAMES[worst] if worst is not None else None}
+    if run_profile is not None:
+        result['profile'] = run_profile.toJson()
+    return result
+
+
+def safeCheckScene(hip, offline=False, profile=False):
+    from preflight import logger
+    dumped = io.StringIO()
+    if logger.ring is not None:
+        logger.ring.stream = dumped
+
+    try:
+        result = checkScene(hip, offline, profile)
+    except Exception as e:
+        logger.log.error("[Batch]%s failed", hip, exc_info=True)
+        result = {'hip': hip, 'error': '{t}: {e}'.format(t=type(e).__name__, e=e)}
+
+    if dumped.getvalue():
+        result['log'] = dumped.getvalue().splitlines()
+    return result
+
+
+def writeResult(path, result):
+    if not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, 'w') as f:
+        json.dump(result, f, indent=4)
+
+
+def serve(profile=False, read='hom', sample='frames'):
+    """
+    Warm worker entry point, runs inside hython. Reads one hip path per line from stdin and writes one JSON
+    result per line to stdout, keeping the hou session and license between scenes
+    """
+    import hou
+    from preflight import core
+    core.setReadBackend(read)
+    core.setSampleMode(sample)
+
+    # Results go to a private copy of stdout and fd 1 to stderr, so neither Python nor native output from
+    # plugins and hscript while a file loads can corrupt the result stream
+    results = os.fdopen(os.dup(1), 'w')
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    for line in sys.stdin:
+        hip = line.strip()
+        if not hip:
+            continue
+        result = safeCheckScene(hip, profile=profile)
+        hou.hipFile.clear(suppress_save_prompt=True)
+        results.write(RESULT_PREFIX + json.dumps(result) + '\n')
+        results.flush()
+    return 0
+
+
+class WarmWorker(object):
+    """
+    A hython process serving scenes one at a time, restarted after max_scenes to bound its memory. Its stderr
+    and any stray stdout are appended to log_path
+    """
+
+    def __init__(self, hython, max_scenes, log_path, profile=False, read='hom', sample='frames'):
+        self.hython = hython
+        self.max_scenes = max_scenes
+        self.log_path = log_path
+        self.profile = profile
+        self.read = read
+        self.sample = sample
+        self.process = None
+        self.log = None
+        self.scenes = 0
+
+    def start(self):
+        command = [self.hython, os.path.abspath(__file__), '--serve']
+        if self.profile:
+            command.append('--profile')
+        command.extend(['--read', self.read, '--sample', self.sample])
+        if self.log is None:
+            self.log = open(self.log_path, 'a')
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                        stderr=self.log, universal_newlines=True)
+        self.scenes = 0
+
+    def stop(self):
+        if self.process is None:
+            return None
+        self.process.stdin.close()
+        code = self.process.wait()
+        self.process = None
+        return code
+
+    def close(self):
+        self.stop()
+        if self.log is not None:
+            self.log.close()
+            self.log = None
+
+    def readResult(self):
+        """
+        Next result line of the worker without its prefix, empty once the worker exited
+        """
+        while True:
+            line = self.process.stdout.readline()
+            if not line or line.startswith(RESULT_PREFIX):
+                return line[len(RESULT_PREFIX):]
+            self.log.write(line)
+            self.log.flush()
+
+    def check(self, hip):
+        if self.process is None:
+            self.start()
+        try:
+            self.process.stdin.write(hip + '\n')
+            self.process.stdin.flush()
+            line = self.readResult()
+        except (IOError, OSError):
+            line = ''
+
+        if not line:
+            code = self.stop()
+            return {'hip': hip, 'error': 'worker exited with code {code}, see {log}'.format(
+                code=code, log=self.log_path)}
+
+        self.scenes += 1
+        if self.scenes >= self.max_scenes:
+            self.stop()
+        try:
+            return json.loads(line)
+        except ValueError as e:
+            return {'hip': hip, 'error': 'unreadable worker result, {e}'.format(e=e)}
+
+
+class WorkerPool(object):
+    """
+    One warm worker per pool thread, each logging to its own file in log_dir
+    """
+
+    def __init__(self, hython, jobs, max_scenes, log_dir, profile=False, read='hom', sample='frames'):
+        self.hython = hython
+        self.max_scenes = max_scenes
+        self.log_dir = log_dir
+        self.profile = profile
+        self.read = read
+        self.sample = sample
+        self.executor = ThreadPoolExecutor(max_workers=jobs)
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.workers = []
+
+    def worker(self):
+        worker = getattr(self.local, 'worker', None)
+        if worker is None:
+            with self.lock:
+                log_path = os.path.join(self.log_dir, 'worker{n}.log'.format(n=len(self.workers) + 1))
+                worker = WarmWorker(self.hython, self.max_scenes, log_path, self.profile, self.read, self.sample)
+                self.workers.append(worker)
+            self.local.worker = worker
+        return worker
+
+    def submit(self, hip):
+        return self.executor.submit(lambda: self.worker().check(hip))
+
+    def close(self):
+        self.executor.shutdown()
+        for worker in self.workers:
+            worker.close()
+
+
+class SceneTimeout(Exception):
+    pass
+
+
+def offlineCheckScene(hip, profile=False, timeout=None):
+    """
+    safeCheckScene() of an offline pool process. A scene still reading after timeout seconds fails instead of
+    holding the process, on platforms with SIGALRM
+    """
+    if not timeout or not hasattr(signal, 'SIGALRM'):
+        return safeCheckScene(hip, True, profile)
+
+    def expire(signum, frame):
+        raise SceneTimeout('no result after {t}s'.format(t=timeout))
+
+    previous = signal.signal(signal.SIGALRM, expire)
+    signal.alarm(timeout)
+    try:
+        return safeCheckScene(hip, True, profile)
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+class OfflinePool(object):
+    """
+    Plain Python processes reading hip files with hipfile, no hython or license needed
+    """
+
+    def __init__(self, jobs, profile=False, timeout=None):
+        self.executor = ProcessPoolExecutor(max_workers=jobs)
+        self.profile = profile
+        self.timeout = timeout
+
+    def submit(self, hip):
+        return self.executor.submit(offlineCheckScene, hip, self.profile, self.timeout)
+
+    def close(self):
+        self.executor.shutdown()
+
+
+def runBatch(pool, hip_files, output_dir):
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+
+    failed = []
+    root = resultRoot(hip_files)
+    futures = [pool.submit(hip) for hip in hip_files]
+    for hip, future in zip(hip_files, futures):
+        result = future.result()
+        writeResult(resultPath(output_dir, root, hip), result)
+        print("[Batch]{hip} {status}".format(hip=hip, status='FAILED' if 'error' in result else 'OK'))
+        if 'error' in result:
+            failed.append(hip)
+    return failed
+
+
+class SceneHandler(socketserver.StreamRequestHandler):
+    """
+    Streams one JSON result line back for every hip path line a client sends, as soon as it is checked
+    """
+
+    def handle(self):
+        lock = threading.Lock()
+        sent = []
+
+        def sender(done):
+            def send(future):
+                try:
+                    with lock:
+                        self.wfile.write((json.dumps(future.result()) + '\n').encode('utf-8'))
+                        self.wfile.flush()
+                finally:
+                    done.set()
+            return send
+
+        for line in self.rfile:
+            hip = line.decode('utf-8').strip()
+            if hip:
+                done = threading.Event()
+                self.server.pool.submit(hip).add_done_callback(sender(done))
+                sent.append(done)
+
+        # Keep the connection open until every result has been written back
+        for done in sent:
+            done.wait()
+
+
+def listen(pool, port):
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', port), SceneHandler)
+    server.daemon_threads = True
+    server.pool = pool
+    print("[Batch]Listening on 127.0.0.1:{port}".format(port=port))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run Houdini preflight checks on .hip files without a UI')
+    parser.add_argument('paths', nargs='*', help='.hip files or directories to search for them')
+    parser.add_argument('-o', '--output', default='preflight', help='directory for the JSON results and worker logs')
+    parser.add_argument('-j', '--jobs', type=int,
+                        help='number of workers, each hython worker takes a Houdini license (default {n}, one '
+                             'per CPU with --offline)'.format(n=HYTHON_JOBS))
+    parser.add_argument('--hython', default=getHython(), help='hython executable')
+    parser.add_argument('--max-scenes', type=int, default=50, help='scenes a worker checks before it restarts')
+    parser.add_argument('--listen', type=int, metavar='PORT',
+                        help='keep the workers warm and accept hip paths on a local port')
+    parser.add_argument('--offline', action='store_true',
+                        help='read hip files directly instead of loading them in hython')
+    parser.add_argument('--timeout', type=int, default=300,
+                        help='seconds an offline scene may take before it fails, 0 for no limit')
+    parser.add_argument('--profile', action='store_true',
+                        help='add per check timings and HOM call counts to every result')
+    parser.add_argument('--read', choices=('hom', 'hscript'), default='hom',
+                        help='read parms with a HOM call each or with one opparm dump per node')
+    parser.add_argument('--sample', choices=('frames', 'changes'), default='frames',
+                        help='evaluate animated render settings on every frame or only around their changes')
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.serve:
+        return serve(args.profile, args.read, args.sample)
+
+    if args.jobs is None:
+        args.jobs = os.cpu_count() if args.offline else HYTHON_JOBS
+    if args.offline:
+        pool = OfflinePool(args.jobs, args.profile, args.timeout)
+    else:
+        log_dir = os.path.join(args.output, 'logs')
+        if not os.path.isdir(log_dir):
+            os.makedirs(log_dir)
+        pool = WorkerPool(args.hython, args.jobs, args.max_scenes, log_dir, args.profile, args.read,
+                          args.sample)
+    try:
+        if args.listen:
+            return listen(pool, args.listen)
+
+        hip_files = findHipFiles(args.paths)
+        if not hip_files:
+            parser.error('no .hip files found')
+
+        failed = runBatch(pool, hip_files, args.output)
+        print("[Batch]{n} scenes checked, {f} failed".format(n=len(hip_files), f=len(failed)))
+        return 1 if failed else 0
+    finally:
+        pool.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,122 @@
+"""
+Synthetic hip corpus
+Writes the small hand-built .hip files the hipfile tests read, as portable ASCII cpio archives of the
+sections a saved scene holds. Rerun after changing a scene here and commit the files it writes.
+
+Usage
+    python tests/corpus/make_corpus.py
+"""
+
+import os
+
+CORPUS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def entry(name, data):
+    """
+    One cpio record, the fields the reader ignores zeroed
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    name = name.encode('utf-8') + b'\0'
+    header = b'070707' + b'000000' * 7 + b'%011o' % 0 + b'%06o' % len(name) + b'%011o' % len(data)
+    return header + name + data
+
+
+def parmSection(parms):
+    """
+    .parm section of parms, a list of (name, values) with the values already written as saved
+    """
+    lines = ['{', 'version 0.8']
+    for name, values in parms:
+        lines.append('{name}\t[ 0\tlocks=0 ]\t(\t{values}\t)'.format(name=name, values='\t'.join(values)))
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def node(path, type_name, parms):
+    return (entry(path + '.init', 'type = {t}\nmatchesdef = 0\n'.format(t=type_name)) +
+            entry(path + '.def', 'sopflags sopflags = \ncomment ""\n') +
+            entry(path + '.parm', parmSection(parms)))
+
+
+def scene(start, *nodes):
+    return entry('.start', start) + b''.join(nodes) + entry('TRAILER!!!', '')
+
+
+def rop(path, camera, first, last, gi='off', moblur='on'):
+    return node(path, 'Redshift_ROP', [
+        ('RS_renderCamera', ['"{c}"'.format(c=camera)]),
+        ('f', ['[ f1\t{f} ]'.format(f=first), '[ f2\t{l} ]'.format(l=last), '1']),
+        ('RS_aov', ['2']),
+        ('RS_aovSuffix_1', ['"U_CRYMAT_matte"']),
+        ('RS_aovID_1', ['1']),
+        ('RS_aovSuffix_2', ['"mv"']),
+        ('RS_aovID_2', ['2']),
+        ('MotionBlurEnabled', [moblur]),
+        ('RS_GIEnabled', [gi]),
+        ('RS_globalEnvironment', ['""']),
+    ])
+
+
+CORPUS = {
+    # A camera, a dome and two ROPs, one rendering a camera that is not in the file
+    'basic.hip': scene(
+        'fps 24\ntset `(1-1)/$FPS` `100/$FPS`\ntcur 0\n',
+        node('obj/cam1', 'cam', [
+            ('res', ['1920', '1080']),
+            ('aspect', ['1']),
+            ('near', ['0.001']),
+            ('far', ['10000']),
+            ('RS_campro_dofEnable', ['off']),
+            ('color', ['0.5', '0.25', '1']),
+            ('label', ['"say \\"hi\\" C:\\\\shots"']),
+        ]),
+        node('obj/dome', 'rslightdome::2.0', [('background_enable', ['on']), ('backPlateEnabled', ['off'])]),
+        rop('out/rs1', '/obj/cam1', 1, 100),
+        rop('out/rs2', '/obj/cam2', 1, 50, gi='on', moblur='off'),
+    ),
+    # A ROP rendering the default /obj/cam1, with no camera in the file
+    'nocamera.hip': scene('fps 24\nframe 1\nfrange 1 100\n', node('out/rs1', 'Redshift_ROP', [('RS_aov', ['0'])])),
+    # ROPs and a light nested in a ropnet, a subnet and an asset, and SOPs that must not be taken for objects
+    'nested.hip': scene(
+        'fps 24\nframe 1\nfrange 1 100\n',
+        node('obj/cam1', 'cam', [('res', ['1920', '1080'])]),
+        node('obj/ropnet1', 'ropnet', []),
+        rop('obj/ropnet1/nested', '/obj/cam1', 1, 100),
+        node('obj/ropnet1/subnet1', 'subnet', []),
+        rop('obj/ropnet1/subnet1/deep', '/obj/cam1', 1, 100),
+        node('obj/rig', 'studio::rig', []),
+        node('obj/rig/key', 'rslight', [('light_type', ['0'])]),
+        node('obj/geo1', 'geo', []),
+        node('obj/geo1/rslight', 'rslight', []),
+        rop('out/rs1', '/obj/cam1', 1, 100),
+    ),
+    # Two ROPs rendering cam1 and one rendering cam2, which has a wide pixel aspect and a zero near clip
+    'cameras.hip': scene(
+        'fps 24\nframe 1\nfrange 1 100\n',
+        node('obj/cam1', 'cam', [('res', ['1920', '1080']), ('aspect', ['1']), ('near', ['0.1']), ('far', ['1000'])]),
+        node('obj/cam2', 'cam', [('res', ['1920', '1080']), ('aspect', ['3']), ('near', ['0']), ('far', ['1000'])]),
+        rop('out/rs1', '/obj/cam1', 1, 100),
+        rop('out/rs2', '/obj/cam1', 1, 100),
+        rop('out/rs3', '/obj/cam2', 1, 100),
+    ),
+    # Playbar range saved as frames
+    'frange.hip': scene('fps 25\nframe 1001\nfrange 1001 1100\n'),
+    # A range expression that would take forever to evaluate
+    'hostile.hip': scene('fps 24\ntset `9**9**9**9` `1`\n'),
+    # Cut off inside the header of its second record
+    'truncated.hip': scene('fps 24\n')[:100],
+    'notcpio.hip': b'HoudiniFile\n' * 20,
+}
+
+
+def main():
+    for name, data in sorted(CORPUS.items()):
+        with open(os.path.join(CORPUS_DIR, name), 'wb') as f:
+            f.write(data)
+        print(name)
+
+
+if __name__ == '__main__':
+    main()
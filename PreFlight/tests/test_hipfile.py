@@ -0,0 +1,228 @@
+"""
+Offline hip reader tests, on the synthetic scenes of tests/corpus written by tests/corpus/make_corpus.py
+
+Usage
+    python -m pytest tests
+"""
+
+import os
+import sys
+import unittest
+
+PREFLIGHT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PREFLIGHT_DIR)
+
+from preflight import core, hipfile  # noqa: E402
+
+CORPUS_DIR = os.path.join(PREFLIGHT_DIR, 'tests', 'corpus')
+
+
+def corpus(name):
+    return os.path.join(CORPUS_DIR, name)
+
+
+def openHip(name):
+    return hipfile.HipFile(corpus(name), use_cache=False)
+
+
+class ScanSectionsTest(unittest.TestCase):
+    def test_sections(self):
+        with open(corpus('basic.hip'), 'rb') as f:
+            data = f.read()
+        sections = {name: data[offset:offset + size] for name, offset, size in hipfile.scanSections(data)}
+        self.assertEqual(sections['.start'], b'fps 24\ntset `(1-1)/$FPS` `100/$FPS`\ntcur 0\n')
+        self.assertEqual(sections['obj/cam1.init'], b'type = cam\nmatchesdef = 0\n')
+        self.assertIn('out/rs2.parm', sections)
+        self.assertNotIn('TRAILER!!!', sections)
+
+    def test_truncated(self):
+        with open(corpus('truncated.hip'), 'rb') as f:
+            data = f.read()
+        with self.assertRaises(hipfile.HipError):
+            list(hipfile.scanSections(data))
+
+    def test_not_cpio(self):
+        with self.assertRaises(hipfile.HipError):
+            openHip('notcpio.hip')
+
+    def test_index(self):
+        with open(corpus('basic.hip'), 'rb') as f:
+            index = hipfile.buildIndex(f.read())
+        self.assertEqual(index['types'], {
+            '/obj/cam1': 'cam',
+            '/obj/dome': 'rslightdome::2.0',
+            '/out/rs1': 'Redshift_ROP',
+            '/out/rs2': 'Redshift_ROP',
+        })
+
+
+class ParseParmsTest(unittest.TestCase):
+    def test_values(self):
+        parms = hipfile.parseParms(
+            '{\nversion 0.8\n'
+            'res\t[ 0\tlocks=0 ]\t(\t1920\t1080\t)\n'
+            'near\t[ 0\tlocks=0 ]\t(\t0.001\t)\n'
+            'RS_GIEnabled\t[ 0\tlocks=0 ]\t(\toff\t)\n'
+            'MotionBlurEnabled\t[ 0\tlocks=0 ]\t(\ton\t)\n'
+            'empty\t[ 0\tlocks=0 ]\t(\t)\n'
+            '}\n')
+        self.assertEqual(parms, {'res': [1920, 1080], 'near': [0.001], 'RS_GIEnabled': [0],
+                                 'MotionBlurEnabled': [1], 'empty': []})
+
+    def test_quoted_strings(self):
+        parms = hipfile.parseParms('camera\t[ 0\tlocks=0 ]\t(\t"/obj/cam 1"\t)\n'
+                                   'label\t[ 0\tlocks=0 ]\t(\t"say \\"hi\\" C:\\\\shots"\t)\n'
+                                   'off\t[ 0\tlocks=0 ]\t(\t"off"\t)\n'
+                                   'suffix\t[ 0\tlocks=0 ]\t(\t"1001"\t)\n')
+        self.assertEqual(parms['camera'], ['/obj/cam 1'])
+        self.assertEqual(parms['label'], ['say "hi" C:\\shots'])
+        # Quoted values are strings even when they read as a toggle or a number
+        self.assertEqual(parms['off'], ['off'])
+        self.assertEqual(parms['suffix'], ['1001'])
+
+    def test_channels(self):
+        parms = hipfile.parseParms('f\t[ 0\tlocks=0 ]\t(\t[ f1\t1001 ]\t[ f2\t1100 ]\t1\t)\n')
+        self.assertEqual(parms['f'], [1001, 1100, 1])
+
+    def test_skips_other_lines(self):
+        self.assertEqual(hipfile.parseParms('{\nversion 0.8\nnot a parm line\n}\n'), {})
+
+
+class HipNodeTest(unittest.TestCase):
+    def setUp(self):
+        self.hip = openHip('basic.hip')
+        self.cam = self.hip.node('/obj/cam1')
+        self.rop = self.hip.node('/out/rs1')
+
+    def tearDown(self):
+        self.hip.close()
+
+    def test_tuple_components(self):
+        self.assertEqual(self.cam.parm('resx').eval(), 1920)
+        self.assertEqual(self.cam.parm('resy').eval(), 1080)
+        self.assertEqual(self.cam.parm('colorg').eval(), 0.25)
+        self.assertEqual(self.rop.parm('f1').eval(), 1)
+        self.assertEqual(self.rop.parm('f2').eval(), 100)
+        self.assertEqual(self.rop.parm('f3').eval(), 1)
+        self.assertEqual(self.cam.parmTuple('res').eval(), (1920, 1080))
+        # Past the end of the tuple
+        self.assertIsNone(self.cam.parm('colora'))
+
+    def test_defaults(self):
+        self.assertEqual(self.rop.parm('RS_aovDeepEnabled').eval(), 0)
+        self.assertEqual(self.hip.node('/obj/dome').parmTuple('res').eval(), (1920, 1080))
+        self.assertIsNone(self.rop.parm('not_a_parm'))
+        self.assertIsNone(self.rop.parmTuple('not_a_parm'))
+
+    def test_glob_parms(self):
+        names = sorted(parm.name() for parm in self.rop.globParms('RS_aovSuffix_* RS_aovID_*'))
+        self.assertEqual(names, ['RS_aovID_1', 'RS_aovID_2', 'RS_aovSuffix_1', 'RS_aovSuffix_2'])
+
+    def test_type(self):
+        self.assertEqual(self.rop.type().nameWithCategory(), 'Driver/Redshift_ROP')
+        self.assertEqual(self.cam.type().nameWithCategory(), 'Object/cam')
+
+    def test_nested_type(self):
+        with openHip('nested.hip') as hip:
+            types = dict((path, node.type().nameWithCategory()) for path, node in hip.nodes.items())
+        self.assertEqual(types['/obj/ropnet1'], 'Object/ropnet')
+        self.assertEqual(types['/obj/ropnet1/nested'], 'Driver/Redshift_ROP')
+        self.assertEqual(types['/obj/ropnet1/subnet1/deep'], 'Driver/Redshift_ROP')
+        self.assertEqual(types['/obj/rig/key'], 'Object/rslight')
+        self.assertEqual(types['/obj/geo1/rslight'], 'Sop/rslight')
+
+
+class PlaybackRangeTest(unittest.TestCase):
+    def test_tset(self):
+        with openHip('basic.hip') as hip:
+            self.assertEqual(hip.playbackRange(), (1.0, 100.0))
+
+    def test_frange(self):
+        with openHip('frange.hip') as hip:
+            self.assertEqual(hip.playbackRange(), (1001.0, 1100.0))
+
+    def test_hostile_expression(self):
+        with openHip('hostile.hip') as hip:
+            with self.assertRaises(hipfile.HipError):
+                hip.playbackRange()
+
+
+class EvalExpressionTest(unittest.TestCase):
+    def test_arithmetic(self):
+        self.assertEqual(hipfile.evalExpression('(1-1)/$FPS', 24), 0.0)
+        self.assertEqual(hipfile.evalExpression('100/$FPS', 25), 4.0)
+        self.assertEqual(hipfile.evalExpression('-2*3+1', 24), -5.0)
+
+    def test_refused(self):
+        for expression in ('9**9**9**9', '2//1', '7%2', '__import__("os")', 'x', '(1).real', '1/0', '',
+                           '1e400*1e400', '1+' * 100000 + '1'):
+            with self.assertRaises(hipfile.HipError, msg=expression[:40]):
+                hipfile.evalExpression(expression, 24)
+
+
+class OfflineChecksTest(unittest.TestCase):
+    def test_run_checks(self):
+        with openHip('basic.hip') as hip:
+            results = core.runChecks(hip)
+        self.assertEqual(results['cameraInfo'][0], '/obj/cam1')
+        self.assertEqual([(f.path, f.key) for f in results['gi']],
+                         [('/out/rs1', 'gi_disabled'), ('/out/rs2', 'gi_enabled')])
+        self.assertEqual([f.text() for f in results['frameRange'][1]], ['rs2 set to 1 - 50'])
+
+    def test_nested_nodes(self):
+        with openHip('nested.hip') as hip:
+            core.runChecks(hip)
+        self.assertEqual([rop.path for rop in core.getSnapshot('Redshift_ROP')],
+                         ['/obj/ropnet1/nested', '/obj/ropnet1/subnet1/deep', '/out/rs1'])
+        self.assertEqual([light.path() for light in core.getRsLight()[0]], ['/obj/rig/key'])
+
+    def test_missing_camera(self):
+        with openHip('nocamera.hip') as hip:
+            results = core.runChecks(hip)
+        self.assertEqual([(f.path, f.key, f.severity) for f in results['cameraInfo'][1]],
+                         [('/obj/cam1', 'camera_missing', core.SEVERITY_ERROR)])
+        self.assertEqual([(f.key, f.severity) for f in results['resolution'][1]],
+                         [('render_camera_missing', core.SEVERITY_ERROR)])
+        self.assertEqual(core.worstSeverity(results), core.SEVERITY_ERROR)
+        self.assertFalse([name for name, result in results.items() if isinstance(result, Exception)])
+
+    def test_camera_findings(self):
+        with openHip('cameras.hip') as hip:
+            results = core.runChecks(hip)
+        self.assertEqual(results['resolution'], ((1920, 1080), []))
+        self.assertEqual([(f.path, f.key, f.severity) for f in results['pixelRatio'][1]],
+                         [('/obj/cam2', 'camera_aspect_invalid', core.SEVERITY_ERROR)])
+        self.assertEqual([(f.path, f.key, f.severity) for f in results['clipPlanes'][1]],
+                         [('/obj/cam2', 'camera_clip', core.SEVERITY_WARNING)])
+        self.assertEqual(results['cameraInfo'][1][0].severity, core.SEVERITY_WARNING)
+        self.assertEqual(core.resultJson(results['pixelRatio'][1][0])['values'], {'value': 3})
+
+        # The window shows the severities the gate counts
+        check = [check for check in core.getChecks() if check.name == 'clipPlanes'][0]
+        self.assertEqual(check.display(results['clipPlanes']),
+                         [('0.1 - 1000', None), ('/obj/cam2 0 - 1000', core.SEVERITY_WARNING)])
+
+    def test_save_status(self):
+        with openHip('basic.hip') as hip:
+            results = core.runChecks(hip)
+        name, status = results['saveStatus']
+        self.assertEqual((name, status.key, status.severity), ('basic.hip', 'file_saved', core.SEVERITY_INFO))
+        self.assertEqual(status.text(), 'File Saved')
+
+    def test_failing_check(self):
+        def broken():
+            raise ValueError('broken check')
+        core.registerCheck()(broken)
+        try:
+            with openHip('basic.hip') as hip:
+                results = core.runChecks(hip)
+        finally:
+            del core.getChecks()[-1]
+        self.assertIsInstance(results['broken'], ValueError)
+        self.assertEqual(core.resultJson(results['broken']), {'error': 'ValueError: broken check'})
+        self.assertEqual(core.worstSeverity(results), core.SEVERITY_ERROR)
+        self.assertIn('gi', results)
+
+
+if __name__ == '__main__':
+    unittest.main()
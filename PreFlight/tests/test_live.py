@@ -0,0 +1,118 @@
+"""
+Live mode tests, LiveChecks on the in-memory hou of preflight.fakehou
+
+Usage
+    python -m pytest tests
+"""
+
+import os
+import sys
+import unittest
+
+PREFLIGHT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PREFLIGHT_DIR)
+
+from preflight import fakehou  # noqa: E402
+
+hou = fakehou.install()
+
+from preflight import core  # noqa: E402
+
+
+class LiveChecksTest(unittest.TestCase):
+    def setUp(self):
+        fakehou.buildScene(rops=2, aovs=4, cams=2, domes=1, lights=0)
+        core.setScene(core.HomScene())
+        core.runChecks()
+        self.live = core.LiveChecks()
+        self.live.start()
+
+    def tearDown(self):
+        self.live.stop()
+
+    def test_watched_networks(self):
+        # SOP networks never hold a ROP, light or camera
+        hou.node('/obj').createNode('geo', 'geo1')
+        self.live.flush()
+        networks = [node.path() for node in self.live.index.watched]
+        self.assertEqual(networks, ['/obj', '/out'])
+        hou.node('/obj/geo1').createNode('null')
+        self.assertFalse(self.live.index_stale)
+
+    def test_new_rop(self):
+        ropnet = hou.node('/obj').createNode('ropnet', 'ropnet1')
+        rop = ropnet.createNode('Redshift_ROP', 'nested')
+        rop.parm('RS_renderCamera').set('/obj/cam3')
+        self.live.flush()
+        self.assertIn('/obj/ropnet1/nested', self.live.watchedPaths('Redshift_ROP'))
+        self.assertIsNotNone(core.getNodeSnapshot('Redshift_ROP', '/obj/ropnet1/nested'))
+        self.assertIn('cameraInfo', self.live.dirty)
+        results = dict((check.name, result) for check, result in self.live.recompute())
+        self.assertIn('camera_missing', [finding.key for finding in results['cameraInfo'][1]])
+
+        # Events on the new ROP reach the snapshot
+        rop.parm('f2').set(50.0)
+        self.live.flush()
+        self.assertEqual(core.getNodeSnapshot('Redshift_ROP', '/obj/ropnet1/nested').values['f2'], 50.0)
+
+        # Creating the missing camera watches it and clears the finding
+        hou.node('/obj').createNode('cam', 'cam3')
+        self.live.flush()
+        self.assertIn('/obj/cam3', self.live.watchedPaths('cam'))
+        results = dict((check.name, result) for check, result in self.live.recompute())
+        self.assertNotIn('camera_missing', [finding.key for finding in results['cameraInfo'][1]])
+
+    def test_new_light(self):
+        hou.node('/obj').createNode('rslightdome::2.0', 'rsdome2')
+        self.live.flush()
+        self.assertEqual(self.live.watchedPaths('rslightdome'), ['/obj/rsdome1', '/obj/rsdome2'])
+        self.assertEqual(len(core.getSnapshot('rslightdome')), 2)
+
+    def test_other_dome_version(self):
+        fakehou.NODE_TYPES['rslightdome::3.0'] = fakehou.NODE_TYPES['rslightdome::2.0']
+        self.addCleanup(fakehou.NODE_TYPES.pop, 'rslightdome::3.0')
+        hou.node('/obj').createNode('rslightdome::3.0', 'rsdome3')
+        self.live.flush()
+        self.assertEqual(self.live.watchedPaths('rslightdome'), ['/obj/rsdome1', '/obj/rsdome3'])
+
+    def test_deleted_rop(self):
+        hou.node('/out/Redshift_ROP2').destroy()
+        self.live.flush()
+        self.assertEqual(self.live.watchedPaths('Redshift_ROP'), ['/out/Redshift_ROP1'])
+        self.assertEqual([rop.path for rop in core.getSnapshot('Redshift_ROP')], ['/out/Redshift_ROP1'])
+
+    def test_event_node_wrapper(self):
+        # Callbacks get a new hou.Node for every event, deleting a node must still stop watching it
+        rop = hou.node('/out/Redshift_ROP2')
+        nodes = []
+        rop.addEventCallback((hou.nodeEventType.BeingDeleted,), lambda node, **kwargs: nodes.append(node))
+        rop.parm('f2').set(50.0)
+        rop.setName('renamed')
+        rop.destroy()
+        self.assertEqual(nodes[0], rop)
+        self.assertIsNot(nodes[0], rop)
+        self.live.flush()
+        self.assertEqual(self.live.watchedPaths('Redshift_ROP'), ['/out/Redshift_ROP1'])
+        self.assertEqual([rop.path for rop in core.getSnapshot('Redshift_ROP')], ['/out/Redshift_ROP1'])
+
+        # Another child event walks the scene again without asking the deleted node for its path
+        hou.node('/out').createNode('Redshift_ROP', 'added')
+        self.live.flush()
+        self.assertEqual(self.live.watchedPaths('Redshift_ROP'), ['/out/Redshift_ROP1', '/out/added'])
+
+    def test_missing_env_parm(self):
+        # A ROP without the parm is reported as unknown rather than as an enabled environment
+        hou.node('/out/Redshift_ROP2').removeParmTuple('RS_globalEnvironment')
+        results = core.runChecks(core.HomScene())
+        self.assertEqual([(f.path, f.key, f.severity) for f in results['rsEnv']],
+                         [('/out/Redshift_ROP2', 'rs_env_unknown', core.SEVERITY_WARNING)])
+
+    def test_unwatch_failed(self):
+        node_type, node, callback, path = self.live.watched[0]
+        node.removeEventCallback(self.live.eventTypes(), callback)
+        self.live.stop()
+        self.assertEqual(self.live.watched, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
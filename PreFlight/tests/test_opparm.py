@@ -0,0 +1,150 @@
+"""
+opparm dump parser tests
+
+Usage
+    python -m pytest tests
+"""
+
+import os
+import sys
+import unittest
+
+PREFLIGHT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PREFLIGHT_DIR)
+
+from preflight import opparm  # noqa: E402
+from preflight.opparm import UNRESOLVED  # noqa: E402
+
+
+class DumpCommandTest(unittest.TestCase):
+    def test_names(self):
+        self.assertEqual(opparm.dumpNames(['f1', 'f2', 'RS_aov', 'resx']), ['RS_aov', 'f', 'f1', 'f2', 'res', 'resx'])
+
+    def test_command(self):
+        self.assertEqual(opparm.dumpCommand('/out/rs1', ['RS_aov', 'f']), 'opparm -d /out/rs1 RS_aov f')
+
+
+class ParseDumpTest(unittest.TestCase):
+    def test_literals(self):
+        dump = opparm.parseDump(
+            "opparm -V 20.0.547 /out/rs1 f ( 1 240 1 ) RS_renderCamera ( /obj/cam1 ) "
+            "RS_aovSuffix_1 ( 'U_CRYMAT matte' ) RS_GIEnabled ( off )\n")
+        self.assertEqual(dump, {'f': ['1', '240', '1'], 'RS_renderCamera': ['/obj/cam1'],
+                                'RS_aovSuffix_1': ['U_CRYMAT matte'], 'RS_GIEnabled': ['off']})
+
+    def test_escaped_quotes(self):
+        dump = opparm.parseDump("opparm /obj/cam1 label ( 'it\\'s C:\\\\shots' )\n")
+        self.assertEqual(dump['label'], ["it's C:\\shots"])
+
+    def test_line_continuation(self):
+        dump = opparm.parseDump("opparm /out/rs1 f ( 1 \\\n 240 1 ) RS_aov ( 2 )\n")
+        self.assertEqual(dump, {'f': ['1', '240', '1'], 'RS_aov': ['2']})
+
+    def test_expressions_unresolved(self):
+        dump = opparm.parseDump("opparm /out/rs1 f ( '$FSTART' `ch(\"../f2\")` 1 ) RS_aov ( 2 )\n")
+        self.assertEqual(dump['f'], [UNRESOLVED, UNRESOLVED, '1'])
+        self.assertIs(opparm.tupleValue(dump, 'f'), UNRESOLVED)
+
+    def test_animated_channels(self):
+        dump = opparm.parseDump(
+            "opparm /out/rs1 f ( 1 240 1 ) RS_GIEnabled ( 1 ) res ( 1920 1080 )\n"
+            "chadd -t 0 10 /out/rs1 f2 RS_GIEnabled\n"
+            "chkey -t 0 -v 1 /out/rs1/resy\n")
+        self.assertEqual(dump['f'], ['1', UNRESOLVED, '1'])
+        self.assertEqual(dump['RS_GIEnabled'], [UNRESOLVED])
+        self.assertEqual(dump['res'], ['1920', UNRESOLVED])
+
+
+class ParmValueTest(unittest.TestCase):
+    def setUp(self):
+        self.dump = {'f': [1, 240, 1], 'res': [1920, 1080], 'RS_aov': [2], 'color': [0.5, 0.25, 1]}
+
+    def test_parm(self):
+        self.assertEqual(opparm.parmValue(self.dump, 'RS_aov'), 2)
+
+    def test_components(self):
+        self.assertEqual(opparm.parmValue(self.dump, 'f1'), 1)
+        self.assertEqual(opparm.parmValue(self.dump, 'f2'), 240)
+        self.assertEqual(opparm.parmValue(self.dump, 'resy'), 1080)
+        self.assertEqual(opparm.parmValue(self.dump, 'colorb'), 1)
+
+    def test_missing(self):
+        self.assertIs(opparm.parmValue(self.dump, 'f4'), UNRESOLVED)
+        self.assertIs(opparm.parmValue(self.dump, 'near'), UNRESOLVED)
+        # A tuple asked for as a single parm
+        self.assertIs(opparm.parmValue(self.dump, 'res'), UNRESOLVED)
+
+    def test_tuple(self):
+        self.assertEqual(opparm.tupleValue(self.dump, 'res'), (1920, 1080))
+        self.assertIs(opparm.tupleValue(self.dump, 'far'), UNRESOLVED)
+
+
+class TypedValueTest(unittest.TestCase):
+    def test_strings(self):
+        # String parms keep values that look like toggles or numbers
+        self.assertEqual(opparm.typedValue('on', ('String', ())), 'on')
+        self.assertEqual(opparm.typedValue('1001', ('String', ())), '1001')
+
+    def test_numbers(self):
+        self.assertEqual(opparm.typedValue('off', ('Toggle', ())), 0)
+        self.assertEqual(opparm.typedValue('240', ('Int', ())), 240)
+        self.assertEqual(opparm.typedValue('1', ('Float', ())), 1.0)
+        self.assertIsInstance(opparm.typedValue('1', ('Float', ())), float)
+        self.assertEqual(opparm.typedValue('4', ('Folder', ())), 4)
+
+    def test_menus(self):
+        menu = ('custom', 'cryptomatte', 'motionvectors')
+        self.assertEqual(opparm.typedValue('motionvectors', ('Menu', menu)), 2)
+        self.assertEqual(opparm.typedValue('cryptomatte', ('Int', menu)), 1)
+        self.assertIs(opparm.typedValue('beauty', ('Menu', menu)), UNRESOLVED)
+
+    def test_unresolved(self):
+        self.assertIs(opparm.typedValue(UNRESOLVED, ('Int', ())), UNRESOLVED)
+        self.assertIs(opparm.typedValue('2', None), UNRESOLVED)
+        self.assertIs(opparm.typedValue('maybe', ('Toggle', ())), UNRESOLVED)
+
+
+class HscriptBackendTest(unittest.TestCase):
+    """
+    The hscript backend reading the opparm dumps of preflight.fakehou, which prints toggles and menu tokens
+    like Houdini does, against the HOM backend
+    """
+
+    def setUp(self):
+        from preflight import fakehou
+        fakehou.install()
+        from preflight import core
+        self.core = core
+        self.hou = fakehou
+        fakehou.buildScene(rops=2, aovs=4, cams=2, domes=1, lights=1)
+        rop = fakehou.node('/out/Redshift_ROP1')
+        rop.parm('RS_globalEnvironment').set('on')
+        rop.parm('RS_aovSuffix_1').set('1001')
+        self.backend = core.getReadBackend()
+
+    def tearDown(self):
+        self.core.setReadBackend(self.backend)
+
+    def snapshot(self, backend):
+        self.core.setReadBackend(backend)
+        results = self.core.resultsJson(self.core.runChecks(self.core.HomScene()))
+        values = dict((node.path, [(name, value, type(value)) for name, value in sorted(node.values.items())])
+                      for nodes in self.core.snapshot.values() for node in nodes)
+        return results, values
+
+    def test_backends_match(self):
+        results, values = self.snapshot('hscript')
+        self.assertEqual((results, values), self.snapshot('hom'))
+        rop = dict((name, value) for name, value, value_type in values['/out/Redshift_ROP1'])
+        self.assertEqual(rop['RS_globalEnvironment'], 'on')
+        self.assertEqual(rop['RS_aovSuffix_*'][0], '1001')
+        self.assertEqual(rop['RS_aovID_*'], [1, 1, 2, 3])
+
+    def test_dump_prints_tokens(self):
+        out, err = self.hou.hscript('opparm -d /out/Redshift_ROP1 RS_aovID_3 RS_GIEnabled')
+        self.assertIn('RS_aovID_3 ( motionvectors )', out)
+        self.assertIn('RS_GIEnabled ( on )', out)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Frame sampling tests, the 'changes' sample mode against evaluating every frame
+
+Usage
+    python -m pytest tests
+"""
+
+import os
+import sys
+import unittest
+
+PREFLIGHT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PREFLIGHT_DIR)
+
+from preflight import fakehou  # noqa: E402
+
+fakehou.install()
+
+from preflight import core  # noqa: E402
+
+FRAMES = [float(frame) for frame in range(1, 101)]
+
+
+def keyframe(frame, value, expression=None):
+    key = fakehou.Keyframe(value)
+    key.setFrame(frame)
+    if expression is not None:
+        key.setExpression(expression)
+    return key
+
+
+def everyFrame(evaluate):
+    return core.FrameSamples(FRAMES, [evaluate(frame) for frame in FRAMES]).spans()
+
+
+def changes(evaluate, keys, dense=()):
+    return core.FrameSamples(*core.sampleChanges(evaluate, FRAMES, keys, dense)).spans()
+
+
+class SampleChangesTest(unittest.TestCase):
+    def test_constant_keys(self):
+        def evaluate(frame):
+            return 1 if 10 <= frame < 40 else 0
+        self.assertEqual(changes(evaluate, [10, 40]), everyFrame(evaluate))
+
+    def test_change_between_keys(self):
+        # A linear ramp rounded by an int parm changes value between its keys
+        def evaluate(frame):
+            return int(min(max((frame - 10) / 30.0, 0.0), 1.0) * 3)
+        self.assertEqual(changes(evaluate, [10, 40]), everyFrame(evaluate))
+
+    def test_overshoot_needs_dense_span(self):
+        # Both keys hold 0 while the segment between them overshoots, as a bezier can
+        def evaluate(frame):
+            return 1 if 13 <= frame <= 17 else 0
+        self.assertNotEqual(changes(evaluate, [10, 20]), everyFrame(evaluate))
+        self.assertEqual(changes(evaluate, [10, 20], dense=[(10, 20)]), everyFrame(evaluate))
+
+
+class PlainSegmentTest(unittest.TestCase):
+    def test_plain(self):
+        for expression in ('constant()', 'linear()', 'ease()', 'easep(0.3)', ' easeout( ) '):
+            self.assertTrue(core.isPlainSegment(keyframe(1, 0, expression)), expression)
+
+    def test_not_plain(self):
+        # Keys without an expression set take Houdini's default bezier()
+        for expression in (None, 'bezier()', 'cubic()', 'spline()', 'linear() + $F % 2', '$F > 12'):
+            self.assertFalse(core.isPlainSegment(keyframe(1, 0, expression)), expression)
+
+
+class FakeKeyframeTest(unittest.TestCase):
+    def test_segments(self):
+        fakehou.buildScene(rops=1, aovs=0, cams=1, domes=0, lights=0)
+        parm = fakehou.node('/out').children()[0].parm('RS_GIEnabled')
+        for key in (keyframe(10, 0, 'linear()'), keyframe(20, 10, '($F - 20) * 2'), keyframe(30, 5)):
+            parm.setKeyframe(key)
+        self.assertEqual([parm.evalAtFrame(frame) for frame in (5, 15, 25, 40)], [0, 5, 10, 5])
+
+    def test_interpolations(self):
+        fakehou.buildScene(rops=1, aovs=0, cams=1, domes=0, lights=0)
+        parm = fakehou.node('/out').children()[0].parm('f2')
+        for expression in ('bezier()', 'ease()', 'cubic()', None):
+            parm.deleteAllKeyframes()
+            parm.setKeyframe(keyframe(10, 0.0, expression))
+            parm.setKeyframe(keyframe(20, 10.0, 'constant()'))
+            values = [parm.evalAtFrame(frame) for frame in (10, 12, 15, 18, 20)]
+            self.assertEqual(values[0], 0.0, expression)
+            self.assertEqual(values[2], 5.0, expression)
+            self.assertEqual(values, sorted(values), expression)
+
+    def test_comparison(self):
+        fakehou.buildScene(rops=1, aovs=0, cams=1, domes=0, lights=0)
+        parm = fakehou.node('/out').children()[0].parm('RS_GIEnabled')
+        parm.setKeyframe(keyframe(1, 1, '($F > 50) * 1'))
+        self.assertEqual([parm.evalAtFrame(frame) for frame in (1, 50, 51, 240)], [0, 0, 1, 1])
+
+
+class RunChecksSamplingTest(unittest.TestCase):
+    """
+    Checks over keys with interpolations the 'changes' mode samples densely, against evaluating every frame
+    """
+
+    def setUp(self):
+        fakehou.buildScene(rops=2, aovs=0, cams=1, domes=0, lights=0)
+        rops = fakehou.node('/out').children()
+        for frame, value, expression in ((1, 1, 'bezier()'), (100, 0, 'ease()'), (150, 1, None)):
+            rops[0].parm('RS_GIEnabled').setKeyframe(keyframe(frame, value, expression))
+        rops[1].parm('RS_GIEnabled').setKeyframe(keyframe(1, 1, '($F > 200) * 1'))
+        self.mode = core.getSampleMode()
+
+    def tearDown(self):
+        core.setSampleMode(self.mode)
+
+    def results(self, mode):
+        core.setSampleMode(mode)
+        results = core.runChecks(core.HomScene())
+        for name, result in results.items():
+            self.assertNotIsInstance(result, Exception, name)
+        return core.resultsJson(results)
+
+    def test_modes_match(self):
+        results = self.results('frames')
+        self.assertEqual(self.results('changes'), results)
+        spans = [(finding['path'], finding['key'], finding['values']) for finding in results['gi']]
+        self.assertEqual(spans[:3], [
+            ('/out/Redshift_ROP1', 'gi_enabled', {'start': 1.0, 'end': 50.0}),
+            ('/out/Redshift_ROP1', 'gi_disabled', {'start': 51.0, 'end': 125.0}),
+            ('/out/Redshift_ROP1', 'gi_enabled', {'start': 126.0, 'end': 240.0}),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()